@@ -197,15 +197,17 @@ def handle_sync_batch(
 
     obj_diff_batch.decision = decision
 
+    # figure out the right verify key to share to
+    # in case of a job with user code, share to user code owner
+    # without user code, share to job owner
+    # this is the same for every diff, and user_code_high walks the whole batch
+    share_to_user: SyftVerifyKey | None = (
+        getattr(obj_diff_batch.user_code_high, "user_verify_key", None)
+        or obj_diff_batch.user_verify_key_high
+    )
+
     sync_instructions = []
     for diff in obj_diff_batch.get_dependencies(include_roots=True):
-        # figure out the right verify key to share to
-        # in case of a job with user code, share to user code owner
-        # without user code, share to job owner
-        share_to_user: SyftVerifyKey | None = (
-            getattr(obj_diff_batch.user_code_high, "user_verify_key", None)
-            or obj_diff_batch.user_verify_key_high
-        )
         share_private_data_for_diff = share_private_data[diff.object_id]
         mockify_for_diff = mockify[diff.object_id]
         instruction = SyncInstruction.from_batch_decision(
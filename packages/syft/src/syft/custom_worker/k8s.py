@@ -124,10 +124,13 @@ class KubeUtils:
         return None
 
     @staticmethod
-    def get_logs(pods: list[Pod]) -> str:
-        """Combine and return logs for all the pods as a single string."""
+    def get_logs(pods: list[Pod], tail_lines: int | None = None) -> str:
+        """Combine and return logs for all the pods as a single string.
+
+        If `tail_lines` is set, only that many most recent lines are fetched per pod.
+        """
         return "\n".join(
-            f"----------Logs for pod={pod.metadata.name}----------\n{''.join(pod.logs())}"
+            f"----------Logs for pod={pod.metadata.name}----------\n{''.join(pod.logs(tail_lines=tail_lines))}"
             for pod in pods
         )
 
@@ -118,9 +118,9 @@ class KubernetesRunner:
             pods.sort(key=lambda pod: pod.name)
         return pods
 
-    def get_pod_logs(self, pod_name: str) -> str:
+    def get_pod_logs(self, pod_name: str, tail_lines: int | None = None) -> str:
         pods = self.client.get("pods", pod_name)
-        return KubeUtils.get_logs(pods)
+        return KubeUtils.get_logs(pods, tail_lines=tail_lines)
 
     def get_pod_status(self, pod: str | Pod) -> PodStatus | None:
         pod = KubeUtils.resolve_pod(self.client, pod)
@@ -311,6 +311,8 @@ class Server(AbstractServer):
 
         # construct services only after init stores
         self.services: ServiceRegistry = ServiceRegistry.for_server(self)
+        # service methods resolved by path, services live as long as the registry
+        self._service_method_cache: dict[str, Callable] = {}
         self.db.init_tables(reset=reset)
         self.action_store = self.services.action.stash
 
@@ -868,11 +870,17 @@ class Server(AbstractServer):
         return self.services.stashes[object_type]
 
     def _get_service_method_from_path(self, path: str) -> Callable:
+        method = self._service_method_cache.get(path)
+        if method is not None:
+            return method
+
         path_list = path.split(".")
         method_name = path_list.pop()
         service_obj = self.services._get_service_from_path(path=path)
 
-        return getattr(service_obj, method_name)
+        method = getattr(service_obj, method_name)
+        self._service_method_cache[path] = method
+        return method
 
     def get_temp_dir(self, dir_name: str = "") -> Path:
         """
@@ -1395,11 +1403,20 @@ class Server(AbstractServer):
         # 🟡 TODO 36: Needs distributed lock
         self.job_stash.set(credentials, job).unwrap()
         self.queue_stash.set_placeholder(credentials, queue_item).unwrap()
+        self.notify_queue_producers()
 
         self.services.log.add(context, log_id, queue_item.job_id)
 
         return job
 
+    def notify_queue_producers(self) -> None:
+        """Wake up local queue producers after queue items were added."""
+        queue_manager = getattr(self, "queue_manager", None)
+        if queue_manager is None:
+            return
+        for producer in queue_manager.producers.values():
+            producer.notify()
+
     def _sort_jobs(self, jobs: list[Job]) -> list[Job]:
         job_datetimes = {}
         for job in jobs:
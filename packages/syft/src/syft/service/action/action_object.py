@@ -1583,7 +1583,7 @@ class ActionObject(SyncableSyftObject):
                 if result.is_ok():
                     context, result_args, result_kwargs = result.ok()
                 else:
-                    logger.debug(f"Pre-hook failed with {result.err()}")
+                    logger.debug("Pre-hook failed with %s", result.err())
         if name not in self._syft_dont_wrap_attrs():
             if HOOK_ALWAYS in self.syft_pre_hooks__:
                 for hook in self.syft_pre_hooks__[HOOK_ALWAYS]:
@@ -1593,7 +1593,7 @@ class ActionObject(SyncableSyftObject):
                     else:
                         msg = str(result.err())
                         msg = msg.replace("\\n", "\n")
-                        logger.debug(f"Pre-hook failed with {msg}")
+                        logger.debug("Pre-hook failed with %s", msg)
 
         if self.is_pointer:
             if name not in self._syft_dont_wrap_attrs():
@@ -1605,7 +1605,7 @@ class ActionObject(SyncableSyftObject):
                         else:
                             msg = str(result.err())
                             msg = msg.replace("\\n", "\n")
-                            logger.debug(f"Pre-hook failed with {msg}")
+                            logger.debug("Pre-hook failed with %s", msg)
 
         return context, result_args, result_kwargs
 
@@ -1620,7 +1620,7 @@ class ActionObject(SyncableSyftObject):
                 if result.is_ok():
                     new_result = result.ok()
                 else:
-                    logger.debug(f"Post hook failed with {result.err()}")
+                    logger.debug("Post hook failed with %s", result.err())
 
         if name not in self._syft_dont_wrap_attrs():
             if HOOK_ALWAYS in self.syft_post_hooks__:
@@ -1629,7 +1629,7 @@ class ActionObject(SyncableSyftObject):
                     if result.is_ok():
                         new_result = result.ok()
                     else:
-                        logger.debug(f"Post hook failed with {result.err()}")
+                        logger.debug("Post hook failed with %s", result.err())
 
         if self.is_pointer:
             if name not in self._syft_dont_wrap_attrs():
@@ -1639,7 +1639,7 @@ class ActionObject(SyncableSyftObject):
                         if result.is_ok():
                             new_result = result.ok()
                         else:
-                            logger.debug(f"Post hook failed with {result.err()}")
+                            logger.debug("Post hook failed with %s", result.err())
 
         return new_result
 
@@ -1764,7 +1764,7 @@ class ActionObject(SyncableSyftObject):
             raise RuntimeError(
                 "[_wrap_attribute_for_properties] Use this only on properties"
             )
-        logger.debug(f"[__getattribute__] Handling property {name}")
+        logger.debug("[__getattribute__] Handling property %s", name)
 
         context = PreHookContext(
             obj=self,
@@ -1788,7 +1788,7 @@ class ActionObject(SyncableSyftObject):
         def fake_func(*args: Any, **kwargs: Any) -> Any:
             return ActionDataEmpty(syft_internal_type=self.syft_internal_type)
 
-        logger.debug(f"[__getattribute__] Handling method {name}")
+        logger.debug("[__getattribute__] Handling method %s", name)
         if (
             issubclass(self.syft_action_data_type, ActionDataEmpty)
             and name not in action_data_empty_must_run
@@ -1825,29 +1825,24 @@ class ActionObject(SyncableSyftObject):
             return post_result
 
         if inspect.ismethod(original_func) or inspect.ismethoddescriptor(original_func):
-            logger.debug(f"Running method: {name}")
+            logger.debug("Running method: %s", name)
 
             def wrapper(_self: Any, *args: Any, **kwargs: Any) -> Any:
                 return _base_wrapper(*args, **kwargs)
 
             wrapper = types.MethodType(wrapper, type(self))
         else:
-            logger.debug(f"Running non-method: {name}")
+            logger.debug("Running non-method: %s", name)
 
             wrapper = _base_wrapper
 
         try:
             wrapper.__doc__ = original_func.__doc__
-            logger.debug(
-                "Found original signature for ",
-                name,
-                inspect.signature(original_func),
-            )
-            wrapper.__ipython_inspector_signature_override__ = inspect.signature(
-                original_func
-            )
+            signature = inspect.signature(original_func)
+            logger.debug("Found original signature for %s: %s", name, signature)
+            wrapper.__ipython_inspector_signature_override__ = signature
         except Exception:
-            logger.debug(f"name={name} has no signature")
+            logger.debug("name=%s has no signature", name)
 
         # third party
         return wrapper
@@ -1941,7 +1936,7 @@ class ActionObject(SyncableSyftObject):
     def __setattr__(self, name: str, value: Any) -> Any:
         defined_on_self = name in self.__dict__ or name in self.__private_attributes__
 
-        logger.debug(f">> {name} defined_on_self={defined_on_self}")
+        logger.debug(">> %s defined_on_self=%s", name, defined_on_self)
 
         # use the custom defined version
         if defined_on_self:
@@ -2190,6 +2185,9 @@ action_types[Any] = AnyActionObject
 
 
 def debug_original_func(name: str, func: Callable) -> None:
+    # runs on every wrapped method access, skip the inspect calls unless logged
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     logger.debug(f"{name} func is:")
     logger.debug(f"inspect.isdatadescriptor = {inspect.isdatadescriptor(func)}")
     logger.debug(f"inspect.isgetsetdescriptor = {inspect.isgetsetdescriptor(func)}")
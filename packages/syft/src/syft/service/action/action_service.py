@@ -275,7 +275,34 @@ class ActionService(AbstractService):
         obj = self.stash.get(
             uid=uid, credentials=context.credentials, has_permission=has_permission
         ).unwrap()
+        return self._resolve_obj(context, obj, twin_mode, resolve_nested).unwrap()
 
+    @as_result(StashException, NotFoundException, SyftException)
+    def _get_many(
+        self,
+        context: AuthedServiceContext,
+        uids: list[UID],
+        twin_mode: TwinMode = TwinMode.PRIVATE,
+        has_permission: bool = False,
+        resolve_nested: bool = True,
+    ) -> dict[UID, ActionObject | TwinObject]:
+        """Get multiple objects from the action store with a single query"""
+        objs = self.stash.get_many(
+            uids=uids, credentials=context.credentials, has_permission=has_permission
+        ).unwrap()
+        return {
+            uid: self._resolve_obj(context, obj, twin_mode, resolve_nested).unwrap()
+            for uid, obj in objs.items()
+        }
+
+    @as_result(StashException, NotFoundException, SyftException)
+    def _resolve_obj(
+        self,
+        context: AuthedServiceContext,
+        obj: ActionObject | TwinObject,
+        twin_mode: TwinMode = TwinMode.PRIVATE,
+        resolve_nested: bool = True,
+    ) -> ActionObject | TwinObject:
         # TODO: Is this necessary?
         if context.server is None:
             raise SyftException(public_message=f"Server not found. Context: {context}")
@@ -719,21 +746,29 @@ class ActionService(AbstractService):
         else:
             return execute_object(self, context, resolved_self, action).unwrap()  # type:ignore[unreachable]
 
-    as_result(SyftException)
-
     def unwrap_nested_actionobjects(
         self, context: AuthedServiceContext, data: Any
-    ) -> Any:
-        """recursively unwraps nested action objects"""
+    ) -> tuple[Any, bool]:
+        """recursively unwraps nested action objects
+
+        Returns the unwrapped data and whether any action objects were found,
+        lists and dicts without action objects are returned as is.
+        """
 
         if isinstance(data, list):
-            return [self.unwrap_nested_actionobjects(context, obj) for obj in data]
+            results = [self.unwrap_nested_actionobjects(context, obj) for obj in data]
+            if not any(found for _, found in results):
+                return data, False
+            return [obj for obj, _ in results], True
 
         if isinstance(data, dict):
-            return {
+            items = {
                 key: self.unwrap_nested_actionobjects(context, obj)
                 for key, obj in data.items()
             }
+            if not any(found for _, found in items.values()):
+                return data, False
+            return {key: obj for key, (obj, _) in items.items()}, True
 
         if isinstance(data, ActionObject):
             res = self.get(context=context, uid=data.id)
@@ -745,35 +780,9 @@ class ActionService(AbstractService):
                     public_message="More than double nesting of ActionObjects is currently not supported"
                 )
 
-            return nested_res
-
-        return data
-
-    def contains_nested_actionobjects(self, data: Any) -> bool:
-        """
-        returns if this is a list/set/dict that contains ActionObjects
-        """
+            return nested_res, True
 
-        def unwrap_collection(col: set | dict | list) -> [Any]:  # type: ignore
-            return_values = []
-            if isinstance(col, dict):
-                values = list(col.values()) + list(col.keys())
-            else:
-                values = list(col)
-            for v in values:
-                if isinstance(v, list | dict | set):
-                    return_values += unwrap_collection(v)
-                else:
-                    return_values.append(v)
-            return return_values
-
-        if isinstance(data, list | dict | set):
-            values = unwrap_collection(data)
-            has_action_object = any(isinstance(x, ActionObject) for x in values)
-            return has_action_object
-        elif isinstance(data, ActionObject):
-            return True
-        return False
+        return data, False
 
     def flatten_action_arg(self, context: AuthedServiceContext, arg: UID) -> None:
         """ "If the argument is a collection (of collections) of ActionObjects,
@@ -786,8 +795,10 @@ class ActionService(AbstractService):
         action_object = self.get(context=root_context, uid=arg)
         data = action_object.syft_action_data
 
-        if self.contains_nested_actionobjects(data):
-            new_data = self.unwrap_nested_actionobjects(context, data)
+        new_data, has_nested_actionobjects = self.unwrap_nested_actionobjects(
+            context, data
+        )
+        if has_nested_actionobjects:
             # Update existing action object with the new flattened data
             action_object.syft_action_data_cache = new_data
 
@@ -989,32 +1000,32 @@ class ActionService(AbstractService):
 def resolve_action_args(
     action: Action, context: AuthedServiceContext, service: ActionService
 ) -> tuple[list, bool]:
-    has_twin_inputs = False
-    args = []
-    for arg_id in action.args:
-        arg_value = service._get(
-            context=context, uid=arg_id, twin_mode=TwinMode.NONE, has_permission=True
-        ).unwrap()
-        if isinstance(arg_value, TwinObject):
-            has_twin_inputs = True
-        args.append(arg_value)
+    args, _, has_twin_inputs = resolve_action_inputs(
+        action, context, service, include_kwargs=False
+    ).unwrap()
     return args, has_twin_inputs
 
 
 @as_result(SyftException)
-def resolve_action_kwargs(
-    action: Action, context: AuthedServiceContext, service: ActionService
-) -> tuple[dict, bool]:
-    has_twin_inputs = False
-    kwargs = {}
-    for key, arg_id in action.kwargs.items():
-        kwarg_value = service._get(
-            context=context, uid=arg_id, twin_mode=TwinMode.NONE, has_permission=True
-        ).unwrap()
-        if isinstance(kwarg_value, TwinObject):
-            has_twin_inputs = True
-        kwargs[key] = kwarg_value
-    return kwargs, has_twin_inputs
+def resolve_action_inputs(
+    action: Action,
+    context: AuthedServiceContext,
+    service: ActionService,
+    include_kwargs: bool = True,
+) -> tuple[list, dict, bool]:
+    """Resolve the args and kwargs of an action, fetching all of them at once"""
+    kwarg_ids = action.kwargs if include_kwargs else {}
+    values = service._get_many(
+        context=context,
+        uids=[*action.args, *kwarg_ids.values()],
+        twin_mode=TwinMode.NONE,
+        has_permission=True,
+    ).unwrap()
+
+    args = [values[arg_id.id] for arg_id in action.args]
+    kwargs = {key: values[arg_id.id] for key, arg_id in kwarg_ids.items()}
+    has_twin_inputs = any(isinstance(value, TwinObject) for value in values.values())
+    return args, kwargs, has_twin_inputs
 
 
 @as_result(SyftException)
@@ -1023,9 +1034,9 @@ def execute_callable(
     context: AuthedServiceContext,
     action: Action,
 ) -> ActionObject:
-    args, has_arg_twins = resolve_action_args(action, context, service).unwrap()
-    kwargs, has_kwargs_twins = resolve_action_kwargs(action, context, service).unwrap()
-    has_twin_inputs = has_arg_twins or has_kwargs_twins
+    args, kwargs, has_twin_inputs = resolve_action_inputs(
+        action, context, service
+    ).unwrap()
     # 🔵 TODO 10: Get proper code From old RunClassMethodAction to ensure the function
     # is not bound to the original object or mutated
 
@@ -1048,20 +1059,23 @@ def execute_callable(
         # if twin_mode == TwinMode.NONE and not has_twin_inputs:
         twin_mode = TwinMode.NONE
         # no twins
-        filtered_args = filter_twin_args(args, twin_mode=twin_mode).unwrap()
-        filtered_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode).unwrap()
+        filtered_args, filtered_kwargs = filter_twin_inputs(
+            args, kwargs, twin_mode=twin_mode
+        ).unwrap()
         result = target_callable(*filtered_args, **filtered_kwargs)
         result_action_object = wrap_result(action.result_id, result)
     else:
         twin_mode = TwinMode.PRIVATE
-        private_args = filter_twin_args(args, twin_mode=twin_mode).unwrap()
-        private_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode).unwrap()
+        private_args, private_kwargs = filter_twin_inputs(
+            args, kwargs, twin_mode=twin_mode
+        ).unwrap()
         private_result = target_callable(*private_args, **private_kwargs)
         result_action_object_private = wrap_result(action.result_id, private_result)
 
         twin_mode = TwinMode.MOCK
-        mock_args = filter_twin_args(args, twin_mode=twin_mode).unwrap()
-        mock_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode).unwrap()
+        mock_args, mock_kwargs = filter_twin_inputs(
+            args, kwargs, twin_mode=twin_mode
+        ).unwrap()
         mock_result = target_callable(*mock_args, **mock_kwargs)
         result_action_object_mock = wrap_result(action.result_id, mock_result)
 
@@ -1083,10 +1097,9 @@ def execute_object(
     twin_mode: TwinMode = TwinMode.NONE,
 ) -> TwinObject | ActionObject:
     unboxed_resolved_self = resolved_self.syft_action_data
-    args, has_arg_twins = resolve_action_args(action, context, service).unwrap()
-
-    kwargs, has_kwargs_twins = resolve_action_kwargs(action, context, service).unwrap()
-    has_twin_inputs = has_arg_twins or has_kwargs_twins
+    args, kwargs, has_twin_inputs = resolve_action_inputs(
+        action, context, service
+    ).unwrap()
 
     # 🔵 TODO 10: Get proper code From old RunClassMethodAction to ensure the function
     # is not bound to the original object or mutated
@@ -1097,19 +1110,22 @@ def execute_object(
         raise SyftException(public_message="could not find target method")
     if twin_mode == TwinMode.NONE and not has_twin_inputs:
         # no twins
-        filtered_args = filter_twin_args(args, twin_mode=twin_mode).unwrap()
-        filtered_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode).unwrap()
+        filtered_args, filtered_kwargs = filter_twin_inputs(
+            args, kwargs, twin_mode=twin_mode
+        ).unwrap()
         result = target_method(*filtered_args, **filtered_kwargs)
         result_action_object = wrap_result(action.result_id, result)
     elif twin_mode == TwinMode.NONE and has_twin_inputs:
         # self isn't a twin but one of the inputs is
-        private_args = filter_twin_args(args, twin_mode=TwinMode.PRIVATE).unwrap()
-        private_kwargs = filter_twin_kwargs(kwargs, twin_mode=TwinMode.PRIVATE).unwrap()
+        private_args, private_kwargs = filter_twin_inputs(
+            args, kwargs, twin_mode=TwinMode.PRIVATE
+        ).unwrap()
         private_result = target_method(*private_args, **private_kwargs)
         result_action_object_private = wrap_result(action.result_id, private_result)
 
-        mock_args = filter_twin_args(args, twin_mode=TwinMode.MOCK).unwrap()
-        mock_kwargs = filter_twin_kwargs(kwargs, twin_mode=TwinMode.MOCK).unwrap()
+        mock_args, mock_kwargs = filter_twin_inputs(
+            args, kwargs, twin_mode=TwinMode.MOCK
+        ).unwrap()
         mock_result = target_method(*mock_args, **mock_kwargs)
         result_action_object_mock = wrap_result(action.result_id, mock_result)
 
@@ -1120,14 +1136,16 @@ def execute_object(
         )
     elif twin_mode == twin_mode.PRIVATE:  # type:ignore
         # twin private path
-        private_args = filter_twin_args(args, twin_mode=twin_mode).unwrap()  # type:ignore[unreachable]
-        private_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode).unwrap()
+        private_args, private_kwargs = filter_twin_inputs(  # type:ignore[unreachable]
+            args, kwargs, twin_mode=twin_mode
+        ).unwrap()
         result = target_method(*private_args, **private_kwargs)
         result_action_object = wrap_result(action.result_id, result)
     elif twin_mode == twin_mode.MOCK:  # type:ignore
         # twin mock path
-        mock_args = filter_twin_args(args, twin_mode=twin_mode).unwrap()  # type:ignore[unreachable]
-        mock_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode).unwrap()
+        mock_args, mock_kwargs = filter_twin_inputs(  # type:ignore[unreachable]
+            args, kwargs, twin_mode=twin_mode
+        ).unwrap()
         target_method = getattr(unboxed_resolved_self, action.op, None)
         result = target_method(*mock_args, **mock_kwargs)
         result_action_object = wrap_result(action.result_id, result)
@@ -1146,22 +1164,32 @@ def wrap_result(result_id: UID, result: Any) -> ActionObject:
     return result_action_object
 
 
+def _twin_action_data(value: ActionObject | TwinObject, twin_mode: TwinMode) -> Any:
+    if isinstance(value, TwinObject):
+        if twin_mode == TwinMode.PRIVATE:
+            return value.private.syft_action_data
+        elif twin_mode == TwinMode.MOCK:
+            return value.mock.syft_action_data
+        else:
+            raise SyftException(
+                public_message=f"Filter can only use {TwinMode.PRIVATE} or {TwinMode.MOCK}"
+            )
+    return value.syft_action_data
+
+
 @as_result(SyftException)
 def filter_twin_args(args: list[Any], twin_mode: TwinMode) -> Any:
-    filtered = []
-    for arg in args:
-        if isinstance(arg, TwinObject):
-            if twin_mode == TwinMode.PRIVATE:
-                filtered.append(arg.private.syft_action_data)
-            elif twin_mode == TwinMode.MOCK:
-                filtered.append(arg.mock.syft_action_data)
-            else:
-                raise SyftException(
-                    public_message=f"Filter can only use {TwinMode.PRIVATE} or {TwinMode.MOCK}"
-                )
-        else:
-            filtered.append(arg.syft_action_data)
-    return filtered
+    return [_twin_action_data(arg, twin_mode) for arg in args]
+
+
+@as_result(SyftException)
+def filter_twin_inputs(
+    args: list[Any], kwargs: dict, twin_mode: TwinMode
+) -> tuple[list[Any], dict[str, Any]]:
+    """Unbox resolved args and kwargs for twin_mode in a single pass"""
+    filtered_args = [_twin_action_data(arg, twin_mode) for arg in args]
+    filtered_kwargs = {k: _twin_action_data(v, twin_mode) for k, v in kwargs.items()}
+    return filtered_args, filtered_kwargs
 
 
 @as_result(SyftException)
@@ -1,10 +1,14 @@
 # future
 from __future__ import annotations
 
+# third party
+from sqlalchemy.orm import Session
+
 # relative
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
 from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
 from ...types.errors import SyftException
@@ -38,6 +42,36 @@ class ActionObjectStash(ObjectStash[ActionObject]):
             has_permission=has_permission,
         ).unwrap()
 
+    @as_result(NotFoundException, SyftException)
+    @with_session
+    def get_many(
+        self,
+        uids: list[UID],
+        credentials: SyftVerifyKey,
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> dict[UID, ActionObject]:
+        """Get multiple objects with a single query, keyed by their UID."""
+        # We only need the UID from LineageID or UID
+        uid_set = {uid.id for uid in uids}
+        if not uid_set:
+            return {}
+
+        query = self.query()
+        if not has_permission:
+            role = self.get_role(credentials, session=session)
+            query = query.with_permissions(credentials, role)
+        query = query.filter_or(*[("id", "eq", uid) for uid in uid_set])
+
+        objs = {row.id: self.row_as_obj(row) for row in query.execute(session).all()}
+        missing = uid_set - objs.keys()
+        if missing:
+            missing_str = ", ".join(str(uid) for uid in missing)
+            raise NotFoundException(
+                f"{self.object_type.__name__}: {missing_str} not found"
+            )
+        return objs
+
     @as_result(NotFoundException, SyftException)
     def get_mock(self, credentials: SyftVerifyKey, uid: UID) -> SyftObject:
         uid = uid.id  # We only need the UID from LineageID or UID
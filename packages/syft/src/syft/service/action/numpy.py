@@ -38,6 +38,14 @@ def numpy_like_eq(left: Any, right: Any) -> bool:
     return bool(result)
 
 
+def _as_contiguous_array(data: Any, dtype: Any) -> np.ndarray:
+    array = np.asarray(data, dtype=dtype)
+    if not array.flags.c_contiguous:
+        # strided inputs fall off numpy's vectorized inner loops
+        array = np.ascontiguousarray(array)
+    return array
+
+
 # 🔵 TODO 7: Map TPActionObjects and their 3rd Party types like numpy type to these
 # classes for bi-directional lookup.
 
@@ -66,7 +74,7 @@ class NumpyArrayObject(ActionObject, np.lib.mixins.NDArrayOperatorsMixin):
     ) -> Self | tuple[Self, ...]:
         inputs = tuple(
             (
-                np.array(x.syft_action_data, dtype=x.dtype)
+                _as_contiguous_array(x.syft_action_data, dtype=x.dtype)
                 if isinstance(x, NumpyArrayObject)
                 else x
             )
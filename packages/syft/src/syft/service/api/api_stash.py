@@ -1,7 +1,11 @@
+# third party
+from sqlalchemy.orm import Session
+
 # relative
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
 from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
 from ...types.result import as_result
@@ -12,6 +16,8 @@ MISSING_PATH_STRING = "Endpoint path: {path} does not exist."
 
 @serializable(canonical_name="TwinAPIEndpointSQLStash", version=1)
 class TwinAPIEndpointStash(ObjectStash[TwinAPIEndpoint]):
+    object_cache_size = 128
+
     @as_result(StashException, NotFoundException)
     def get_by_path(self, credentials: SyftVerifyKey, path: str) -> TwinAPIEndpoint:
         # TODO standardize by returning None if endpoint doesnt exist.
@@ -27,9 +33,17 @@ class TwinAPIEndpointStash(ObjectStash[TwinAPIEndpoint]):
         return res.unwrap()
 
     @as_result(StashException)
-    def path_exists(self, credentials: SyftVerifyKey, path: str) -> bool:
-        try:
-            self.get_by_path(credentials=credentials, path=path).unwrap()
-            return True
-        except NotFoundException:
-            return False
+    @with_session
+    def path_exists(
+        self, credentials: SyftVerifyKey, path: str, session: Session = None
+    ) -> bool:
+        # Only the id column is needed, skip deserializing the endpoint
+        role = self.get_role(credentials, session=session)
+        query = (
+            self.query()
+            .with_permissions(credentials, role)
+            .filter("path", "eq", path)
+            .select("id")
+            .limit(1)
+        )
+        return query.execute(session).first() is not None
@@ -6,4 +6,4 @@ from ...types.blob_storage import BlobStorageEntry
 
 @serializable(canonical_name="BlobStorageSQLStash", version=1)
 class BlobStorageStash(ObjectStash[BlobStorageEntry]):
-    pass
+    object_cache_size = 128
@@ -28,13 +28,22 @@ from .job_stash import JobStash
 from .job_stash import JobStatus
 
 
+# First and max duration (in seconds) between predicate checks in wait_until
+WAIT_UNTIL_MIN_INTERVAL_SEC = 0.1
+WAIT_UNTIL_MAX_INTERVAL_SEC = 1.0
+
+
 def wait_until(predicate: Callable[[], bool], timeout: int = 10) -> SyftSuccess:
     start = time.time()
-    code_string = inspect.getsource(predicate).strip()
+    interval = WAIT_UNTIL_MIN_INTERVAL_SEC
     while time.time() - start < timeout:
         if predicate():
+            code_string = inspect.getsource(predicate).strip()
             return SyftSuccess(message=f"Predicate {code_string} is True")
-        time.sleep(1)
+        # check often at first, most waits are over within a few ticks
+        time.sleep(interval)
+        interval = min(interval * 2, WAIT_UNTIL_MAX_INTERVAL_SEC)
+    code_string = inspect.getsource(predicate).strip()
     raise SyftException(public_message=f"Timeout reached for predicate {code_string}")
 
 
@@ -131,6 +140,7 @@ class JobService(AbstractService):
         ).unwrap()
 
         self.stash.set(context.credentials, job).unwrap()
+        context.server.notify_queue_producers()
         context.server.services.log.restart(context, job.log_id)
 
         return SyftSuccess(message="Great Success!")
@@ -159,11 +169,15 @@ class JobService(AbstractService):
                 res = self.stash.update(context.credentials, obj=subjob).unwrap()
                 results.append(res)
 
-        # wait for job and subjobs to be killed by MonitorThread
+        # wait for job and subjobs to be killed by MonitorThread,
+        # all subjob statuses are read with a single stash query
         wait_until(lambda: job.fetched_status == JobStatus.INTERRUPTED)
         wait_until(
             lambda: all(
-                subjob.fetched_status == JobStatus.INTERRUPTED for subjob in job.subjobs
+                subjob.status == JobStatus.INTERRUPTED
+                for subjob in self.stash.get_by_parent_id(
+                    context.credentials, uid=job.id
+                ).unwrap()
             )
         )
 
@@ -6,6 +6,9 @@ import secrets
 from typing import Any
 from typing import cast
 
+# third party
+from sqlalchemy.orm import Session
+
 # relative
 from ...abstract_server import ServerType
 from ...client.client import HTTPConnection
@@ -17,6 +20,7 @@ from ...server.worker_settings import WorkerSettings
 from ...service.settings.settings import ServerSettings
 from ...store.db.db import DBManager
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
 from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
 from ...types.errors import SyftException
@@ -125,6 +129,28 @@ class NetworkStash(ObjectStash[ServerPeer]):
             filters={"verify_key": verify_key},
         ).unwrap()
 
+    @as_result(StashException)
+    @with_session
+    def get_by_verify_keys(
+        self,
+        credentials: SyftVerifyKey,
+        verify_keys: list[SyftVerifyKey],
+        session: Session = None,
+    ) -> dict[SyftVerifyKey, ServerPeer]:
+        """Get the peers for multiple verify keys with a single query.
+        Verify keys without a matching peer are left out of the result."""
+        if not verify_keys:
+            return {}
+
+        role = self.get_role(credentials, session=session)
+        query = (
+            self.query()
+            .with_permissions(credentials, role)
+            .filter_or(*[("verify_key", "eq", key) for key in verify_keys])
+        )
+        peers = [self.row_as_obj(row) for row in query.execute(session).all()]
+        return {peer.verify_key: peer for peer in peers}
+
     @as_result(StashException)
     def get_by_server_type(
         self, credentials: SyftVerifyKey, server_type: ServerType
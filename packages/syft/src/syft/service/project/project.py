@@ -6,6 +6,7 @@ from collections.abc import Callable
 from collections.abc import Iterable
 import copy
 import hashlib
+from itertools import chain
 import textwrap
 import time
 from typing import Any
@@ -722,11 +723,11 @@ class Project(SyftObject):
         return [*self.members, *self.users]
 
     def key_in_project(self, verify_key: SyftVerifyKey) -> bool:
-        project_verify_keys = [
-            identity.verify_key for identity in self.get_all_identities()
-        ]
-
-        return verify_key in project_verify_keys
+        # stop at the first match instead of collecting every key first
+        return any(
+            identity.verify_key == verify_key
+            for identity in chain(self.members, self.users)
+        )
 
     def get_identity_from_key(
         self, verify_key: SyftVerifyKey
@@ -1,6 +1,5 @@
 # stdlib
-
-# stdlib
+from concurrent.futures import ThreadPoolExecutor
 
 # relative
 from ...serde.serializable import serializable
@@ -12,6 +11,7 @@ from ...types.errors import SyftException
 from ...types.result import as_result
 from ...types.uid import UID
 from ..context import AuthedServiceContext
+from ..network.server_peer import ServerPeer
 from ..notification.notifications import CreateNotification
 from ..response import SyftError
 from ..response import SyftSuccess
@@ -70,12 +70,13 @@ class ProjectService(AbstractService):
     ) -> None:
         if project_event.seq_no is None:
             raise SyftException(public_message=f"{project_event}.seq_no is None")
-        if project_event.seq_no <= len(project.events) and len(project.events) > 0:
+        last_seq_no = project.get_last_seq_no()
+        if project_event.seq_no <= last_seq_no and last_seq_no > 0:
             # TODO: We need a way to handle alert returns...
             # e.g. here used to be:
             # SyftNotReady(message="Project out of sync event")
             raise SyftException(public_message="Project events are out of sync")
-        if project_event.seq_no > len(project.events) + 1:
+        if project_event.seq_no > last_seq_no + 1:
             raise SyftException(public_message="Project events are out of order")
 
     def is_project_leader(
@@ -237,20 +238,38 @@ class ProjectService(AbstractService):
         self.check_for_project_request(project, project_event, context)
 
         # Broadcast the event to all the members of the project
-        for member in project.members:
-            if member.verify_key != context.server.verify_key:
-                # Retrieving the ServerPeer Object to communicate with the server
-                peer = context.server.services.network.stash.get_by_verify_key(
-                    credentials=context.server.verify_key,
-                    verify_key=member.verify_key,
-                ).unwrap(
+        members = [
+            member
+            for member in project.members
+            if member.verify_key != context.server.verify_key
+        ]
+        # Retrieving the ServerPeer Objects to communicate with the servers
+        peers = context.server.services.network.stash.get_by_verify_keys(
+            credentials=context.server.verify_key,
+            verify_keys=[member.verify_key for member in members],
+        ).unwrap()
+        for member in members:
+            if member.verify_key not in peers:
+                raise SyftException(
                     public_message=f"Leader server does not have peer {member.name}-{member.id.short()}"
                     + ". Please exchange routes with the peer."
                 )
-                remote_client = peer.client_with_context(context=context).unwrap(
-                    public_message=f"Failed to create remote client for peer: {peer.id}."
-                )
-                remote_client.api.services.project.add_event(project_event)
+
+        def send_event(peer: ServerPeer) -> None:
+            remote_client = peer.client_with_context(context=context).unwrap(
+                public_message=f"Failed to create remote client for peer: {peer.id}."
+            )
+            remote_client.api.services.project.add_event(project_event)
+
+        if members:
+            # Members are independent servers, send the event to all of them concurrently
+            with ThreadPoolExecutor(max_workers=min(len(members), 20)) as executor:
+                futures = [
+                    executor.submit(send_event, peers[member.verify_key])
+                    for member in members
+                ]
+                for future in futures:
+                    future.result()
 
         updated_project = self.stash.update(context.server.verify_key, project).unwrap()
 
@@ -284,8 +303,18 @@ class ProjectService(AbstractService):
         return project.events[seq_no:]
 
     @service_method(path="project.get_all", name="get_all", roles=GUEST_ROLE_LEVEL)
-    def get_all(self, context: AuthedServiceContext) -> list[Project]:
-        projects: list[Project] = self.stash.get_all(context.credentials).unwrap()
+    def get_all(
+        self,
+        context: AuthedServiceContext,
+        page_size: int | None = 0,
+        page_index: int | None = 0,
+    ) -> list[Project]:
+        # page in the database, so only the requested projects are deserialized
+        limit = page_size if page_size else None
+        offset = page_size * page_index if page_size and page_index else 0
+        projects: list[Project] = self.stash.get_all(
+            context.credentials, limit=limit, offset=offset
+        ).unwrap()
 
         for idx, project in enumerate(projects):
             projects[idx] = self.add_signing_key_to_project(context, project)
@@ -363,7 +392,7 @@ class ProjectService(AbstractService):
             context (AuthedServiceContext): Context of the server
 
         Returns:
-            SyftSuccess: SyftSuccess if message is created else SyftError
+            None: nothing is allocated or sent for events that are not requests
         """
         if (
             isinstance(project_event, ProjectRequest)
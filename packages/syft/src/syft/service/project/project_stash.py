@@ -14,6 +14,8 @@ from .project import Project
 
 @serializable(canonical_name="ProjectSQLStash", version=1)
 class ProjectStash(ObjectStash[Project]):
+    object_cache_size = 128
+
     @as_result(StashException)
     def get_all_for_verify_key(
         self, credentials: SyftVerifyKey, verify_key: SyftVerifyKey
@@ -64,6 +64,10 @@ class QueueProducer:
     ) -> None:
         raise NotImplementedError
 
+    def notify(self) -> None:
+        """Signal that new items were added to the queue stash."""
+        pass
+
     def close(self) -> None:
         raise NotImplementedError
 
@@ -3,12 +3,16 @@ from collections.abc import Callable
 from enum import Enum
 from typing import Any
 
+# third party
+from sqlalchemy.orm import Session
+
 # relative
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...server.worker_settings import WorkerSettings
 from ...server.worker_settings import WorkerSettingsV1
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
 from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
 from ...store.linked_obj import LinkedObject
@@ -195,6 +199,32 @@ class QueueStash(ObjectStash[QueueItem]):
             filters={"status": status},
         ).unwrap()
 
+    @as_result(StashException)
+    @with_session
+    def get_by_statuses(
+        self,
+        credentials: SyftVerifyKey,
+        statuses: list[Status],
+        session: Session = None,
+    ) -> dict[Status, list[QueueItem]]:
+        """Get the queue items for multiple statuses with a single query,
+        grouped by status."""
+        items: dict[Status, list[QueueItem]] = {status: [] for status in statuses}
+        if not statuses:
+            return items
+
+        role = self.get_role(credentials, session=session)
+        query = (
+            self.query()
+            .with_permissions(credentials, role)
+            .filter_or(*[("status", "eq", status) for status in statuses])
+            .order_by()
+        )
+        for row in query.execute(session).all():
+            item = self.row_as_obj(row)
+            items[item.status].append(item)
+        return items
+
     @as_result(StashException)
     def _get_by_worker_pool(
         self, credentials: SyftVerifyKey, worker_pool: LinkedObject
@@ -1,5 +1,5 @@
 # stdlib
-import threading
+from collections import deque
 import time
 from typing import Any
 
@@ -24,15 +24,21 @@ THREAD_TIMEOUT_SEC = 5
 # Max duration (in ms) to wait for ZMQ poller to return
 ZMQ_POLLER_TIMEOUT_MSEC = 1000
 
+# Min/max duration (in seconds) the producer waits between queue stash reads,
+# the wait backs off while idle and is cut short when new items are queued
+QUEUE_READ_MIN_INTERVAL_SEC = 0.05
+QUEUE_READ_MAX_INTERVAL_SEC = 1.0
+
+# Duration (in seconds) over which worker consumer state changes are coalesced
+# before being written to the worker stash
+CONSUMER_STATE_FLUSH_INTERVAL_SEC = 0.1
+
 # Duration (in seconds) after which a worker without a heartbeat will be marked as expired
 WORKER_TIMEOUT_SEC = 60
 
 # Duration (in seconds) after which producer without a heartbeat will be marked as expired
 PRODUCER_TIMEOUT_SEC = 60
 
-# Lock for working on ZMQ socket
-ZMQ_SOCKET_LOCK = threading.Lock()
-
 MAX_RECURSION_NESTED_ACTIONOBJECTS = 5
 
 
@@ -77,8 +83,8 @@ class Timeout:
 class Service:
     def __init__(self, name: str) -> None:
         self.name = name
-        self.requests: list[bytes] = []
-        self.waiting: list[Worker] = []  # List of waiting workers
+        self.requests: deque[bytes] = deque()  # FIFO of pending requests
+        self.waiting: dict[bytes, Worker] = {}  # Waiting workers by identity
 
 
 class Worker(SyftBaseModel):
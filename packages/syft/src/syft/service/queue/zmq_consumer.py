@@ -24,7 +24,6 @@ from .zmq_common import Timeout
 from .zmq_common import ZMQCommand
 from .zmq_common import ZMQHeader
 from .zmq_common import ZMQ_POLLER_TIMEOUT_MSEC
-from .zmq_common import ZMQ_SOCKET_LOCK
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +70,8 @@ class ZMQConsumer(QueueConsumer):
         self.verbose = verbose
         self.id = UID().short()
         self._stop = Event()
+        # zmq sockets are not thread safe, serialize sends on this socket only
+        self._socket_lock = threading.Lock()
         self.syft_worker_id = syft_worker_id
         self.worker_stash = worker_stash
         self.post_init()
@@ -176,10 +177,10 @@ class ZMQConsumer(QueueConsumer):
         core = [b"", ZMQHeader.W_WORKER, command]
         msg = core + msg
 
-        if command != ZMQCommand.W_HEARTBEAT:
-            logger.info(f"ZMQ Consumer send: {core}")
+        if command != ZMQCommand.W_HEARTBEAT and logger.isEnabledFor(logging.INFO):
+            logger.info("ZMQ Consumer send: %s", core)
 
-        with ZMQ_SOCKET_LOCK:
+        with self._socket_lock:
             try:
                 self.socket.send_multipart(msg)
             except zmq.ZMQError as e:
@@ -216,9 +217,11 @@ class ZMQConsumer(QueueConsumer):
                     # [empty, header, command, ...data]
                     (_, _, command, *data) = msg
 
-                    if command != ZMQCommand.W_HEARTBEAT:
+                    if command != ZMQCommand.W_HEARTBEAT and logger.isEnabledFor(
+                        logging.INFO
+                    ):
                         # log everything except the last frame which contains serialized data
-                        logger.info(f"ZMQConsumer recv: {msg[:-4]}")
+                        logger.info("ZMQConsumer recv: %s", msg[:-4])
 
                     if command == ZMQCommand.W_REQUEST:
                         # Call Message Handler
@@ -2,10 +2,8 @@
 from binascii import hexlify
 import itertools
 import logging
-import sys
 import threading
 from threading import Event
-from time import sleep
 from typing import Any
 
 # third party
@@ -17,6 +15,8 @@ from ...serde.serializable import serializable
 from ...serde.serialize import _serialize as serialize
 from ...service.action.action_object import ActionObject
 from ...service.context import AuthedServiceContext
+from ...store.document_store_errors import NotFoundException
+from ...store.linked_obj import LinkedObject
 from ...types.errors import SyftException
 from ...types.result import as_result
 from ...types.uid import UID
@@ -26,9 +26,13 @@ from ..worker.worker_pool import ConsumerState
 from ..worker.worker_stash import WorkerStash
 from .base_queue import QueueProducer
 from .queue_stash import ActionQueueItem
+from .queue_stash import QueueItem
 from .queue_stash import QueueStash
 from .queue_stash import Status
+from .zmq_common import CONSUMER_STATE_FLUSH_INTERVAL_SEC
 from .zmq_common import HEARTBEAT_INTERVAL_SEC
+from .zmq_common import QUEUE_READ_MAX_INTERVAL_SEC
+from .zmq_common import QUEUE_READ_MIN_INTERVAL_SEC
 from .zmq_common import Service
 from .zmq_common import THREAD_TIMEOUT_SEC
 from .zmq_common import Timeout
@@ -36,7 +40,6 @@ from .zmq_common import Worker
 from .zmq_common import ZMQCommand
 from .zmq_common import ZMQHeader
 from .zmq_common import ZMQ_POLLER_TIMEOUT_MSEC
-from .zmq_common import ZMQ_SOCKET_LOCK
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +63,8 @@ class ZMQProducer(QueueProducer):
         self.queue_name = queue_name
         self.auth_context = context
         self._stop = Event()
+        self._wake = Event()
+        self._state_wake = Event()
         self.post_init()
 
     @property
@@ -70,21 +75,51 @@ class ZMQProducer(QueueProducer):
         """Initialize producer state."""
 
         self.services: dict[str, Service] = {}
+        # workers by their raw socket address
         self.workers: dict[bytes, Worker] = {}
-        self.waiting: list[Worker] = []
+        self.waiting: dict[bytes, Worker] = {}
+        # worker pool names by pool id, cleared whenever workers come and go
+        self._pool_name_cache: dict[UID, str] = {}
+        # ids of CREATED queue items whose action inputs are all resolved
+        self._resolved_items: set[UID] = set()
+        # latest consumer state per syft worker and its sequence number,
+        # written by the state flusher
+        self._pending_states: dict[UID, tuple[int, ConsumerState]] = {}
+        # bumped on every state change of a syft worker, writes of older
+        # states are dropped
+        self._state_seq: dict[UID, int] = {}
+        self._pending_states_lock = threading.Lock()
         self.heartbeat_t = Timeout(HEARTBEAT_INTERVAL_SEC)
         self.context = zmq.Context(1)
         self.socket = self.context.socket(zmq.ROUTER)
+        # zmq sockets are not thread safe, serialize sends on this socket only
+        self._socket_lock = threading.Lock()
         self.socket.setsockopt(LINGER, 1)
         self.socket.setsockopt_string(zmq.IDENTITY, self.id)
         self.poll_workers = zmq.Poller()
         self.poll_workers.register(self.socket, zmq.POLLIN)
+        # read_items signals _run over this pair once it queued new requests,
+        # so they are dispatched without waiting for the poll timeout
+        self._dispatch_wake = self.context.socket(zmq.PAIR)
+        self._dispatch_wake.setsockopt(LINGER, 0)
+        self._dispatch_wake.bind(f"inproc://dispatch-wake-{self.id}")
+        self._dispatch_wake_signal = self.context.socket(zmq.PAIR)
+        self._dispatch_wake_signal.setsockopt(LINGER, 0)
+        self._dispatch_wake_signal.connect(f"inproc://dispatch-wake-{self.id}")
+        self.poll_workers.register(self._dispatch_wake, zmq.POLLIN)
         self.bind(f"tcp://*:{self.port}")
         self.thread: threading.Thread | None = None
         self.producer_thread: threading.Thread | None = None
+        self.state_thread: threading.Thread | None = None
+
+    def notify(self) -> None:
+        """Wake up the queue reader, new items were added to the queue stash."""
+        self._wake.set()
 
     def close(self) -> None:
         self._stop.set()
+        self._wake.set()
+        self._state_wake.set()
         try:
             if self.thread:
                 self.thread.join(THREAD_TIMEOUT_SEC)
@@ -104,10 +139,22 @@ class ZMQProducer(QueueProducer):
                     )
                 self.producer_thread = None
 
+            if self.state_thread:
+                self.state_thread.join(THREAD_TIMEOUT_SEC)
+                if self.state_thread.is_alive():
+                    logger.error(
+                        f"ZMQProducer consumer state thread join timed out during closing. "
+                        f"Queue name {self.queue_name}, "
+                    )
+                self.state_thread = None
+
             self.poll_workers.unregister(self.socket)
+            self.poll_workers.unregister(self._dispatch_wake)
         except Exception as e:
             logger.exception("Failed to unregister poller.", exc_info=e)
         finally:
+            self._dispatch_wake_signal.close()
+            self._dispatch_wake.close()
             self.socket.close()
             self.context.destroy()
 
@@ -119,110 +166,146 @@ class ZMQProducer(QueueProducer):
             raise Exception(f"{self.auth_context} does not have a server.")
 
     @as_result(SyftException)
-    def contains_unresolved_action_objects(self, arg: Any, recursion: int = 0) -> bool:
-        """recursively check collections for unresolved action objects"""
-        if isinstance(arg, UID):
-            arg = self.action_service.get(self.auth_context, arg)
-            return self.contains_unresolved_action_objects(
-                arg, recursion=recursion + 1
-            ).unwrap()
-        if isinstance(arg, ActionObject):
-            if not arg.syft_resolved:
-                arg = self.action_service.get(self.auth_context, arg)
-                if not arg.syft_resolved:
-                    return True
-            arg = arg.syft_action_data
-
-        value = False
-        if isinstance(arg, list):
-            for elem in arg:
-                value = self.contains_unresolved_action_objects(
-                    elem, recursion=recursion + 1
-                ).unwrap()
-                if value:
-                    return True
-        if isinstance(arg, dict):
-            for elem in arg.values():
-                value = self.contains_unresolved_action_objects(
-                    elem, recursion=recursion + 1
-                ).unwrap()
-                if value:
-                    return True
-        return value
+    def contains_unresolved_action_objects(self, arg: Any) -> bool:
+        """check (nested) collections for unresolved action objects"""
+        stack = [arg]
+        fetched: set[UID] = set()
+        while stack:
+            value = stack.pop()
+            if isinstance(value, UID):
+                # resolve each uid at most once per call
+                if value in fetched:
+                    continue
+                fetched.add(value)
+                value = self.action_service.get(self.auth_context, value)
+            if isinstance(value, ActionObject):
+                if not value.syft_resolved:
+                    value = self.action_service.get(self.auth_context, value)
+                    if not value.syft_resolved:
+                        return True
+                data_type = value.syft_action_data_type
+                if data_type is not None and not issubclass(data_type, list | dict):
+                    # leaf payloads such as arrays cannot hold action objects,
+                    # skip loading them from blob storage
+                    continue
+                value = value.syft_action_data
+
+            # visit elements in order, the stack is popped from the end
+            if isinstance(value, list):
+                stack.extend(reversed(value))
+            elif isinstance(value, dict):
+                stack.extend(reversed(value.values()))
+        return False
 
     def read_items(self) -> None:
+        interval = QUEUE_READ_MIN_INTERVAL_SEC
         while True:
+            # poll quickly while items are being dispatched, back off while idle
+            self._wake.wait(timeout=interval)
+            self._wake.clear()
             if self._stop.is_set():
                 break
+            dispatched = False
             try:
-                sleep(1)
-
-                # Items to be queued
-                items_to_queue = self.queue_stash.get_by_status(
+                # Items to be queued and items that are in the processing state
+                items_by_status = self.queue_stash.get_by_statuses(
                     self.queue_stash.root_verify_key,
-                    status=Status.CREATED,
+                    statuses=[Status.CREATED, Status.PROCESSING],
                 ).unwrap()
+                items_to_queue = items_by_status[Status.CREATED]
+                items_processing = items_by_status[Status.PROCESSING]
+                # forget items that are no longer waiting to be queued
+                self._resolved_items.intersection_update(
+                    item.id for item in items_to_queue
+                )
 
-                items_to_queue = [] if items_to_queue is None else items_to_queue
+                for item in itertools.chain(items_to_queue, items_processing):
+                    # a failing item is marked errored, the others are still handled
+                    try:
+                        if self.queue_item(item):
+                            dispatched = True
+                            self._wake_dispatch()
+                    except Exception:
+                        logger.exception(f"Failed to queue item {item.id}")
+                        self._resolved_items.discard(item.id)
+                        item.status = Status.ERRORED
+                        res = self.queue_stash.update(item.syft_client_verify_key, item)
+                        if res.is_err():
+                            logger.error(
+                                f"Failed to mark queue item {item.id} as errored: {res.err()}"
+                            )
+            except Exception:
+                logger.exception("ZMQProducer failed to read queue items")
 
-                # Queue Items that are in the processing state
-                items_processing = self.queue_stash.get_by_status(
-                    self.queue_stash.root_verify_key,
-                    status=Status.PROCESSING,
-                ).unwrap()
+            if dispatched:
+                interval = QUEUE_READ_MIN_INTERVAL_SEC
+            else:
+                interval = min(interval * 2, QUEUE_READ_MAX_INTERVAL_SEC)
+
+    def _wake_dispatch(self) -> None:
+        """Wake _run to dispatch newly queued requests, only called by read_items."""
+        try:
+            self._dispatch_wake_signal.send(b"", zmq.NOBLOCK)
+        except zmq.Again:
+            # a wake-up is already pending
+            pass
 
-                items_processing = [] if items_processing is None else items_processing
+    def queue_item(self, item: QueueItem) -> bool:
+        """Append a CREATED item to its service's requests.
 
-                for item in itertools.chain(items_to_queue, items_processing):
-                    # TODO: if resolving fails, set queueitem to errored, and jobitem as well
-                    if item.status == Status.CREATED:
-                        if isinstance(item, ActionQueueItem):
-                            action = item.kwargs["action"]
-                            if (
-                                self.contains_unresolved_action_objects(
-                                    action.args
-                                ).unwrap()
-                                or self.contains_unresolved_action_objects(
-                                    action.kwargs
-                                ).unwrap()
-                            ):
-                                continue
-
-                        msg_bytes = serialize(item, to_bytes=True)
-                        worker_pool = item.worker_pool.resolve_with_context(
-                            self.auth_context
-                        ).unwrap()
-                        service_name = worker_pool.name
-                        service: Service | None = self.services.get(service_name)
-
-                        # Skip adding message if corresponding service/pool
-                        # is not registered.
-                        if service is None:
-                            continue
-
-                        # append request message to the corresponding service
-                        # This list is processed in dispatch method.
-
-                        # TODO: Logic to evaluate the CAN RUN Condition
-                        item.status = Status.PROCESSING
-                        self.queue_stash.update(
-                            item.syft_client_verify_key, item
-                        ).unwrap(public_message=f"failed to update queue item {item}")
-                        service.requests.append(msg_bytes)
-                    elif item.status == Status.PROCESSING:
-                        # Evaluate Retry condition here
-                        # If job running and timeout or job status is KILL
-                        # or heartbeat fails
-                        # or container id doesn't exists, kill process or container
-                        # else decrease retry count and mark status as CREATED.
-                        pass
-            except Exception as e:
-                # stdlib
-                import traceback
-
-                print(e, traceback.format_exc(), file=sys.stderr)
-                item.status = Status.ERRORED
-                self.queue_stash.update(item.syft_client_verify_key, item).unwrap()
+        Returns True if the item was handed to a service.
+        """
+        # TODO: if resolving fails, set queueitem to errored, and jobitem as well
+        if item.status == Status.CREATED:
+            if (
+                isinstance(item, ActionQueueItem)
+                and item.id not in self._resolved_items
+            ):
+                action = item.kwargs["action"]
+                if self.contains_unresolved_action_objects(
+                    [action.args, action.kwargs]
+                ).unwrap():
+                    return False
+                # inputs stay resolved, skip the walk on later ticks
+                self._resolved_items.add(item.id)
+
+            service_name = self._resolve_pool_name(item.worker_pool)
+            service: Service | None = self.services.get(service_name)
+
+            # Skip adding message if corresponding service/pool
+            # is not registered.
+            if service is None:
+                return False
+
+            # append request message to the corresponding service
+            # This list is processed in dispatch method.
+            msg_bytes = serialize(item, to_bytes=True)
+
+            # TODO: Logic to evaluate the CAN RUN Condition
+            item.status = Status.PROCESSING
+            self.queue_stash.update(item.syft_client_verify_key, item).unwrap(
+                public_message=f"failed to update queue item {item}"
+            )
+            service.requests.append(msg_bytes)
+            self._resolved_items.discard(item.id)
+            return True
+        elif item.status == Status.PROCESSING:
+            # Evaluate Retry condition here
+            # If job running and timeout or job status is KILL
+            # or heartbeat fails
+            # or container id doesn't exists, kill process or container
+            # else decrease retry count and mark status as CREATED.
+            pass
+        return False
+
+    def _resolve_pool_name(self, worker_pool: LinkedObject) -> str:
+        pool_name = self._pool_name_cache.get(worker_pool.object_uid)
+        if pool_name is None:
+            pool_name = (
+                worker_pool.resolve_with_context(self.auth_context).unwrap().name
+            )
+            self._pool_name_cache[worker_pool.object_uid] = pool_name
+        return pool_name
 
     def run(self) -> None:
         self.thread = threading.Thread(target=self._run)
@@ -231,6 +314,9 @@ class ZMQProducer(QueueProducer):
         self.producer_thread = threading.Thread(target=self.read_items)
         self.producer_thread.start()
 
+        self.state_thread = threading.Thread(target=self.flush_consumer_states)
+        self.state_thread.start()
+
     def send(self, worker: bytes, message: bytes | list[bytes]) -> None:
         worker_obj = self.require_worker(worker)
         self.send_to_worker(worker_obj, ZMQCommand.W_REQUEST, message)
@@ -243,8 +329,9 @@ class ZMQProducer(QueueProducer):
     def send_heartbeats(self) -> None:
         """Send heartbeats to idle workers if it's time"""
         if self.heartbeat_t.has_expired():
-            for worker in self.waiting:
-                self.send_to_worker(worker, ZMQCommand.W_HEARTBEAT)
+            if self.waiting:
+                for worker in self.waiting.values():
+                    self.send_to_worker(worker, ZMQCommand.W_HEARTBEAT)
             self.heartbeat_t.reset()
 
     def purge_workers(self) -> None:
@@ -252,8 +339,11 @@ class ZMQProducer(QueueProducer):
 
         Workers are oldest to most recent, so we stop at the first alive worker.
         """
+        if not self.waiting:
+            return
+
         # work on a copy of the iterator
-        for worker in self.waiting:
+        for worker in list(self.waiting.values()):
             res = worker._syft_worker(self.worker_stash, self.auth_context.credentials)
             if res.is_err() or (syft_worker := res.ok()) is None:
                 logger.info(f"Failed to retrieve SyftWorker {worker.syft_worker_id}")
@@ -272,38 +362,75 @@ class ZMQProducer(QueueProducer):
     def update_consumer_state_for_worker(
         self, syft_worker_id: UID, consumer_state: ConsumerState
     ) -> None:
+        """Record the consumer state of a worker, the state flusher writes it."""
+        with self._pending_states_lock:
+            seq = self._state_seq.get(syft_worker_id, 0) + 1
+            self._state_seq[syft_worker_id] = seq
+            self._pending_states[syft_worker_id] = (seq, consumer_state)
+        self._state_wake.set()
+
+    def flush_consumer_states(self) -> None:
+        while True:
+            self._state_wake.wait()
+            self._state_wake.clear()
+            stopping = self._stop.is_set()
+            if not stopping:
+                # let rapid state changes of the same worker collapse into one write
+                self._stop.wait(CONSUMER_STATE_FLUSH_INTERVAL_SEC)
+            self._write_consumer_states()
+            if stopping or self._stop.is_set():
+                break
+
+    def _write_consumer_states(self) -> None:
         if self.worker_stash is None:
             logger.error(  # type: ignore[unreachable]
                 f"ZMQProducer worker stash not defined for {self.queue_name} - {self.id}"
             )
             return
 
-        try:
+        # the lock is not held during the writes, so the poll thread never
+        # waits on the database
+        with self._pending_states_lock:
+            pending_states, self._pending_states = self._pending_states, {}
+
+        for syft_worker_id, (seq, consumer_state) in pending_states.items():
+            if self._is_stale_consumer_state(syft_worker_id, seq):
+                # the worker was dispatched since, it writes its own state
+                continue
             try:
-                self.worker_stash.get_by_uid(
+                # update_consumer_state already looks the worker up
+                self.worker_stash.update_consumer_state(
                     credentials=self.worker_stash.root_verify_key,
-                    uid=syft_worker_id,
+                    worker_uid=syft_worker_id,
+                    consumer_state=consumer_state,
                 ).unwrap()
+            except NotFoundException:
+                # worker was deleted in the meantime
+                continue
             except Exception:
-                return None
-
-            self.worker_stash.update_consumer_state(
-                credentials=self.worker_stash.root_verify_key,
-                worker_uid=syft_worker_id,
-                consumer_state=consumer_state,
-            ).unwrap()
-        except Exception:
-            logger.exception(
-                f"Failed to update consumer state for worker id: {syft_worker_id} to state {consumer_state}",
-            )
+                logger.exception(
+                    f"Failed to update consumer state for worker id: {syft_worker_id} to state {consumer_state}",
+                )
+
+    def _is_stale_consumer_state(self, syft_worker_id: UID, seq: int) -> bool:
+        with self._pending_states_lock:
+            return self._state_seq.get(syft_worker_id) != seq
+
+    def discard_consumer_state_for_worker(self, syft_worker_id: UID | None) -> None:
+        """Drop a pending consumer state, the worker now reports its own state."""
+        if syft_worker_id is None:
+            return
+        with self._pending_states_lock:
+            # also marks a state the flusher is about to write as stale
+            self._state_seq[syft_worker_id] = self._state_seq.get(syft_worker_id, 0) + 1
+            self._pending_states.pop(syft_worker_id, None)
 
     def worker_waiting(self, worker: Worker) -> None:
         """This worker is now waiting for work."""
         # Queue to broker and service waiting lists
-        if worker not in self.waiting:
-            self.waiting.append(worker)
-        if worker.service is not None and worker not in worker.service.waiting:
-            worker.service.waiting.append(worker)
+        self.waiting.setdefault(worker.identity, worker)
+        if worker.service is not None:
+            worker.service.waiting.setdefault(worker.identity, worker)
         worker.reset_expiry()
         self.update_consumer_state_for_worker(worker.syft_worker_id, ConsumerState.IDLE)
         self.dispatch(worker.service, None)
@@ -313,12 +440,18 @@ class ZMQProducer(QueueProducer):
         if msg is not None:  # Queue message if any
             service.requests.append(msg)
 
-        self.purge_workers()
+        # only purge when requests are about to be handed out, _run purges
+        # every loop anyway
+        if service.waiting and service.requests:
+            self.purge_workers()
         while service.waiting and service.requests:
             # One worker consuming only one message at a time.
-            msg = service.requests.pop(0)
-            worker = service.waiting.pop(0)
-            self.waiting.remove(worker)
+            msg = service.requests.popleft()
+            identity = next(iter(service.waiting))
+            worker = service.waiting.pop(identity)
+            self.waiting.pop(identity, None)
+            # the consumer writes CONSUMING itself, a stale IDLE must not follow
+            self.discard_consumer_state_for_worker(worker.syft_worker_id)
             self.send_to_worker(worker, ZMQCommand.W_REQUEST, msg)
 
     def send_to_worker(
@@ -345,13 +478,15 @@ class ZMQProducer(QueueProducer):
         core = [worker.address, b"", ZMQHeader.W_WORKER, command]
         msg = core + msg
 
-        if command != ZMQCommand.W_HEARTBEAT:
+        if command != ZMQCommand.W_HEARTBEAT and logger.isEnabledFor(logging.INFO):
             # log everything except the last frame which contains serialized data
-            logger.info(f"ZMQProducer send: {core}")
+            logger.info("ZMQProducer send: %s", core)
 
-        with ZMQ_SOCKET_LOCK:
+        with self._socket_lock:
             try:
-                self.socket.send_multipart(msg)
+                # zero-copy for large serialized payloads, zmq still copies
+                # frames below zmq.COPY_THRESHOLD
+                self.socket.send_multipart(msg, copy=False)
             except zmq.ZMQError:
                 logger.exception("ZMQProducer send error")
 
@@ -365,53 +500,71 @@ class ZMQProducer(QueueProducer):
                 for service in self.services.values():
                     self.dispatch(service, None)
 
-                items = None
+                items = {}
 
                 try:
-                    items = self.poll_workers.poll(ZMQ_POLLER_TIMEOUT_MSEC)
+                    items = dict(self.poll_workers.poll(ZMQ_POLLER_TIMEOUT_MSEC))
                 except Exception as e:
                     logger.exception("ZMQProducer poll error", exc_info=e)
 
-                if items:
-                    msg = self.socket.recv_multipart()
-
-                    if len(msg) < 3:
-                        logger.error(f"ZMQProducer invalid recv: {msg}")
-                        continue
-
-                    # ZMQProducer recv frames: [address, empty, header, command, ...data]
-                    (address, _, header, command, *data) = msg
-
-                    if command != ZMQCommand.W_HEARTBEAT:
-                        # log everything except the last frame which contains serialized data
-                        logger.info(f"ZMQProducer recv: {msg[:4]}")
-
-                    if header == ZMQHeader.W_WORKER:
-                        self.process_worker(address, command, data)
-                    else:
-                        logger.error(f"Invalid message header: {header}")
+                if self._dispatch_wake in items:
+                    # new requests are dispatched at the top of the loop
+                    while True:
+                        try:
+                            self._dispatch_wake.recv(zmq.NOBLOCK)
+                        except zmq.Again:
+                            break
+
+                if self.socket in items:
+                    # handle everything that arrived since the last poll,
+                    # not just a single message per poll cycle
+                    while True:
+                        try:
+                            msg = self.socket.recv_multipart(zmq.NOBLOCK)
+                        except zmq.Again:
+                            break
+                        self.process_message(msg)
 
                 self.send_heartbeats()
                 self.purge_workers()
         except Exception as e:
             logger.exception("ZMQProducer thread exception", exc_info=e)
 
+    def process_message(self, msg: list[bytes]) -> None:
+        if len(msg) < 3:
+            logger.error(f"ZMQProducer invalid recv: {msg}")
+            return
+
+        # ZMQProducer recv frames: [address, empty, header, command, ...data]
+        (address, _, header, command, *data) = msg
+
+        if command != ZMQCommand.W_HEARTBEAT and logger.isEnabledFor(logging.INFO):
+            # log everything except the last frame which contains serialized data
+            logger.info("ZMQProducer recv: %s", msg[:4])
+
+        if header == ZMQHeader.W_WORKER:
+            self.process_worker(address, command, data)
+        else:
+            logger.error(f"Invalid message header: {header!r}")
+
     def require_worker(self, address: bytes) -> Worker:
         """Finds the worker (creates if necessary)."""
-        identity = hexlify(address)
-        worker = self.workers.get(identity)
+        worker = self.workers.get(address)
         if worker is None:
-            worker = Worker(identity=identity, address=address)
-            self.workers[identity] = worker
+            worker = Worker(identity=hexlify(address), address=address)
+            self.workers[address] = worker
         return worker
 
     def process_worker(self, address: bytes, command: bytes, data: list[bytes]) -> None:
-        worker_ready = hexlify(address) in self.workers
-        worker = self.require_worker(address)
+        worker = self.workers.get(address)
+        worker_ready = worker is not None
+        if worker is None:
+            worker = self.require_worker(address)
 
         if ZMQCommand.W_READY == command:
             service_name = data.pop(0).decode()
             syft_worker_id = data.pop(0).decode()
+            self._pool_name_cache.clear()
             if worker_ready:
                 # Not first command in session or Reserved service name
                 # If worker was already present, then we disconnect it first
@@ -427,7 +580,7 @@ class ZMQProducer(QueueProducer):
                     self.services[service_name] = service
                 if service is not None:
                     worker.service = service
-                logger.info(f"New worker: {worker}")
+                logger.info("New worker: %s", worker)
                 worker.syft_worker_id = UID(syft_worker_id)
                 self.worker_waiting(worker)
 
@@ -448,16 +601,16 @@ class ZMQProducer(QueueProducer):
 
     def delete_worker(self, worker: Worker, disconnect: bool) -> None:
         """Deletes worker from all data structures, and deletes worker."""
+        self._pool_name_cache.clear()
         if disconnect:
             self.send_to_worker(worker, ZMQCommand.W_DISCONNECT)
 
-        if worker.service and worker in worker.service.waiting:
-            worker.service.waiting.remove(worker)
+        if worker.service:
+            worker.service.waiting.pop(worker.identity, None)
 
-        if worker in self.waiting:
-            self.waiting.remove(worker)
+        self.waiting.pop(worker.identity, None)
 
-        self.workers.pop(worker.identity, None)
+        self.workers.pop(worker.address, None)
 
         if worker.syft_worker_id is not None:
             self.update_consumer_state_for_worker(
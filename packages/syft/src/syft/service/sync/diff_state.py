@@ -674,10 +674,10 @@ class ObjectDiffBatch(SyftObject):
         if self.root_diff.status == "NEW":
             return "NEW"
 
-        batch_statuses = [
-            diff.status for diff in self.get_dependencies(include_roots=False)
-        ]
-        if all(status == "SAME" for status in batch_statuses):
+        # stop at the first dependency that is not SAME
+        if all(
+            diff.status == "SAME" for diff in self.get_dependencies(include_roots=False)
+        ):
             return "SAME"
 
         return "MODIFIED"
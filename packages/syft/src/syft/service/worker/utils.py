@@ -1,5 +1,6 @@
 # stdlib
-import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
 import os
 from pathlib import Path
@@ -41,6 +42,17 @@ logger = logging.getLogger(__name__)
 DEFAULT_WORKER_IMAGE_TAG = "openmined/default-worker-image-cpu:0.0.1"
 DEFAULT_WORKER_POOL_NAME = "default-pool"
 K8S_SERVER_CREDS_NAME = "server-creds"
+# Max number of threads sharing the docker client, one per pooled connection
+DOCKER_CLIENT_MAX_THREADS = docker.constants.DEFAULT_MAX_POOL_SIZE
+
+
+@lru_cache(maxsize=1)
+def get_docker_client() -> docker.DockerClient:
+    """Shared docker client, reuses its connection pool across container calls.
+
+    The client is owned by this cache, callers must not close it.
+    """
+    return docker.from_env()
 
 
 def backend_container_name() -> str:
@@ -60,13 +72,17 @@ def get_container(
     return existing_container
 
 
+@lru_cache(maxsize=1)
+def get_backend_container(docker_client: docker.DockerClient) -> Container | None:
+    """The container this server runs in, fixed for the lifetime of the process."""
+    return get_container(docker_client, container_name=backend_container_name())
+
+
 def extract_config_from_backend(
     worker_name: str, docker_client: docker.DockerClient
 ) -> dict[str, Any]:
     # Existing main backend container
-    backend_container = get_container(
-        docker_client, container_name=backend_container_name()
-    )
+    backend_container = get_backend_container(docker_client)
 
     # Config with defaults
     extracted_config: dict[str, Any] = {
@@ -540,22 +556,29 @@ def run_containers(
     logger.info(f"Starting workers with start_idx={start_idx} count={number}")
 
     if orchestration == WorkerOrchestrationType.DOCKER:
-        with contextlib.closing(docker.from_env()) as client:
-            for worker_count in range(start_idx + 1, number + 1):
-                worker_name = f"{pool_name}-{worker_count}"
-                spawn_result = run_container_using_docker(
-                    docker_client=client,
-                    worker_name=worker_name,
-                    worker_count=worker_count,
-                    worker_image=worker_image,
-                    pool_name=pool_name,
-                    queue_port=queue_port,
-                    debug=dev_mode,
-                    username=registry_username,
-                    password=registry_password,
-                    registry_url=reg_url,
-                )
-                results.append(spawn_result)
+        client = get_docker_client()
+
+        def start_container(worker_count: int) -> ContainerSpawnStatus:
+            return run_container_using_docker(
+                docker_client=client,
+                worker_name=f"{pool_name}-{worker_count}",
+                worker_count=worker_count,
+                worker_image=worker_image,
+                pool_name=pool_name,
+                queue_port=queue_port,
+                debug=dev_mode,
+                username=registry_username,
+                password=registry_password,
+                registry_url=reg_url,
+            )
+
+        worker_counts = range(start_idx + 1, number + 1)
+        if worker_counts:
+            # each start mostly waits on dockerd, run them side by side;
+            # map keeps the results in worker order
+            max_workers = min(len(worker_counts), DOCKER_CLIENT_MAX_THREADS)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(start_container, worker_counts))
     elif orchestration == WorkerOrchestrationType.KUBERNETES:
         return run_workers_in_kubernetes(
             worker_image=worker_image,
@@ -1,5 +1,4 @@
 # stdlib
-import contextlib
 
 # third party
 import docker
@@ -22,6 +21,7 @@ from ..service import service_method
 from ..user.user_roles import DATA_OWNER_ROLE_LEVEL
 from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
 from .image_registry import SyftImageRegistry
+from .utils import get_docker_client
 from .utils import image_build
 from .utils import image_push
 from .worker_image import SyftWorkerImage
@@ -216,8 +216,7 @@ class SyftWorkerImageService(AbstractService):
         elif image and image.image_identifier:
             try:
                 full_tag: str = image.image_identifier.full_name_with_tag
-                with contextlib.closing(docker.from_env()) as client:
-                    client.images.remove(image=full_tag)
+                get_docker_client().images.remove(image=full_tag)
             except docker.errors.ImageNotFound:
                 raise SyftException(public_message=f"Image Tag: {full_tag} not found.")
             except Exception as e:
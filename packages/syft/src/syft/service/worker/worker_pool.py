@@ -277,13 +277,12 @@ class ContainerSpawnStatus(SyftBaseModel):
 def _get_worker_container(
     client: docker.DockerClient,
     worker: SyftWorker,
-) -> Container:
+) -> Container | None:
+    """Get the container of a worker, None if the container does not exist."""
     try:
         return cast(Container, client.containers.get(worker.container_id))
-    except docker.errors.NotFound as e:
-        raise SyftException(
-            public_message=f"Worker {worker.id} container not found. Error {e}"
-        )
+    except docker.errors.NotFound:
+        return None
     except docker.errors.APIError as e:
         raise SyftException(
             public_message=f"Unable to access worker {worker.id} container. "
@@ -312,6 +311,8 @@ def _get_worker_container_status(
 ) -> Container:
     if container is None:
         container = _get_worker_container(client, worker).unwrap()
+    if container is None:
+        raise SyftException(public_message=f"Worker {worker.id} container not found.")
     container_status = container.status
 
     return _CONTAINER_STATUS_TO_WORKER_STATUS.get(
@@ -4,6 +4,7 @@ from typing import Any
 
 # third party
 import pydantic
+from sqlalchemy.orm import Session
 
 # relative
 from ...custom_worker.config import DockerWorkerConfig
@@ -127,29 +128,40 @@ class SyftWorkerPoolService(AbstractService):
 
         # Create worker pool from given image, with the given worker pool
         # and with the desired number of workers
-        worker_list, container_statuses = _create_workers_in_pool(
+        container_statuses = _create_workers_in_pool(
             context=context,
             pool_name=pool_name,
             existing_worker_cnt=0,
             worker_cnt=num_workers,
             worker_image=worker_image,
-            worker_stash=worker_stash,
             registry_username=registry_username,
             registry_password=registry_password,
             pod_annotations=pod_annotations,
             pod_labels=pod_labels,
         ).unwrap()
 
-        # Update the Database with the pool information
-        worker_pool = WorkerPool(
-            name=pool_name,
-            max_count=num_workers,
-            image_id=worker_image.id,
-            worker_list=worker_list,
-            syft_server_location=context.server.id,
-            syft_client_verify_key=context.credentials,
-        )
-        self.stash.set(credentials=context.credentials, obj=worker_pool).unwrap()
+        # Write the workers and the pool in a single transaction, only once the
+        # containers are started so no connection is held while they spawn
+        with self.stash.sessionmaker() as session, session.begin():
+            worker_list = _save_workers_in_pool(
+                context=context,
+                container_statuses=container_statuses,
+                worker_stash=worker_stash,
+                session=session,
+            )
+
+            # Update the Database with the pool information
+            worker_pool = WorkerPool(
+                name=pool_name,
+                max_count=num_workers,
+                image_id=worker_image.id,
+                worker_list=worker_list,
+                syft_server_location=context.server.id,
+                syft_client_verify_key=context.credentials,
+            )
+            self.stash.set(
+                credentials=context.credentials, obj=worker_pool, session=session
+            ).unwrap()
         return container_statuses
 
     @service_method(
@@ -384,21 +396,31 @@ class SyftWorkerPoolService(AbstractService):
         worker_stash = context.server.services.worker.stash
 
         # Add workers to given pool from the given image
-        worker_list, container_statuses = _create_workers_in_pool(
+        container_statuses = _create_workers_in_pool(
             context=context,
             pool_name=worker_pool.name,
             existing_worker_cnt=existing_worker_cnt,
             worker_cnt=number,
             worker_image=worker_image,
-            worker_stash=worker_stash,
             registry_username=registry_username,
             registry_password=registry_password,
         ).unwrap()
 
-        worker_pool.worker_list += worker_list
-        worker_pool.max_count = existing_worker_cnt + number
+        # Write the new workers and the pool in a single transaction
+        with self.stash.sessionmaker() as session, session.begin():
+            worker_list = _save_workers_in_pool(
+                context=context,
+                container_statuses=container_statuses,
+                worker_stash=worker_stash,
+                session=session,
+            )
 
-        self.stash.update(credentials=context.credentials, obj=worker_pool).unwrap()
+            worker_pool.worker_list += worker_list
+            worker_pool.max_count = existing_worker_cnt + number
+
+            self.stash.update(
+                credentials=context.credentials, obj=worker_pool, session=session
+            ).unwrap()
         return container_statuses
 
     @service_method(
@@ -645,20 +667,14 @@ class SyftWorkerPoolService(AbstractService):
                 self.scale(context=context, number=0, pool_id=uid)
                 runner.delete_pool(pool_name=worker_pool.name)
         else:
-            workers = (
+            workers = [
                 worker.resolve_with_context(context=context).unwrap()
                 for worker in worker_pool.worker_list
+            ]
+            context.server.services.worker._delete_workers(
+                context=context, workers=workers, force=True
             )
 
-            worker_ids = []
-            for worker in workers:
-                worker_ids.append(worker.id)
-
-            for id_ in worker_ids:
-                context.server.services.worker.delete(
-                    context=context, uid=id_, force=True
-                )
-
         worker_pool.max_count = 0
         worker_pool.worker_list = []
         self.stash.update(
@@ -701,12 +717,11 @@ def _create_workers_in_pool(
     existing_worker_cnt: int,
     worker_cnt: int,
     worker_image: SyftWorkerImage,
-    worker_stash: WorkerStash,
     registry_username: str | None = None,
     registry_password: str | None = None,
     pod_annotations: dict[str, str] | None = None,
     pod_labels: dict[str, str] | None = None,
-) -> tuple[list[LinkedObject], list[ContainerSpawnStatus]]:
+) -> list[ContainerSpawnStatus]:
     queue_port = context.server.queue_config.client_config.queue_port
 
     # Check if workers needs to be run in memory or as containers
@@ -741,6 +756,15 @@ def _create_workers_in_pool(
             pod_labels=pod_labels,
         ).unwrap()
 
+    return container_statuses
+
+
+def _save_workers_in_pool(
+    context: AuthedServiceContext,
+    container_statuses: list[ContainerSpawnStatus],
+    worker_stash: WorkerStash,
+    session: Session | None = None,
+) -> list[LinkedObject]:
     linked_worker_list = []
 
     for container_status in container_statuses:
@@ -754,6 +778,7 @@ def _create_workers_in_pool(
             obj = worker_stash.set(
                 credentials=context.credentials,
                 obj=worker,
+                session=session,
             ).unwrap()
 
             worker_obj = LinkedObject.from_obj(
@@ -765,7 +790,7 @@ def _create_workers_in_pool(
             linked_worker_list.append(worker_obj)
         except SyftException as exc:
             container_status.error = exc.public_message
-    return linked_worker_list, container_statuses
+    return linked_worker_list
 
 
 TYPE_TO_SERVICE[WorkerPool] = SyftWorkerPoolService
@@ -1,5 +1,9 @@
 # stdlib
-import contextlib
+from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+import logging
 from typing import Any
 from typing import cast
 
@@ -26,7 +30,9 @@ from ..user.user_roles import ADMIN_ROLE_LEVEL
 from ..user.user_roles import DATA_OWNER_ROLE_LEVEL
 from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
 from .utils import DEFAULT_WORKER_POOL_NAME
+from .utils import DOCKER_CLIENT_MAX_THREADS
 from .utils import _get_healthcheck_based_on_status
+from .utils import get_docker_client
 from .utils import map_pod_to_worker_status
 from .worker_pool import ContainerSpawnStatus
 from .worker_pool import SyftWorker
@@ -36,6 +42,14 @@ from .worker_pool import _get_worker_container
 from .worker_pool import _get_worker_container_status
 from .worker_stash import WorkerStash
 
+logger = logging.getLogger(__name__)
+
+# Max duration (in seconds) to wait for docker to finish removing a worker container
+WORKER_CONTAINER_REMOVE_TIMEOUT_SEC = 60
+
+# Default number of most recent log lines returned for a worker
+WORKER_LOGS_DEFAULT_TAIL = 10_000
+
 
 @serializable(canonical_name="WorkerService", version=1)
 class WorkerService(AbstractService):
@@ -111,23 +125,33 @@ class WorkerService(AbstractService):
         context: AuthedServiceContext,
         uid: UID,
         raw: bool = False,
+        tail: int | None = WORKER_LOGS_DEFAULT_TAIL,
     ) -> bytes | str:
+        """Get the last `tail` lines of a worker's logs, all lines if `tail` is None."""
         worker = self._get_worker(context=context, uid=uid).unwrap()
 
         if context.server is not None and context.server.in_memory_workers:
             logs = b"Logs not implemented for In Memory Workers"
         elif IN_KUBERNETES:
             runner = KubernetesRunner()
-            return runner.get_pod_logs(pod_name=worker.name)
+            return runner.get_pod_logs(pod_name=worker.name, tail_lines=tail)
         else:
-            with contextlib.closing(docker.from_env()) as client:
-                docker_container = _get_worker_container(client, worker).unwrap()
-                try:
-                    logs = cast(bytes, docker_container.logs())
-                except docker.errors.APIError as e:
-                    raise SyftException(
-                        public_message=f"Failed to get worker {worker.id} container logs. Error {e}"
-                    )
+            docker_container = _get_worker_container(
+                get_docker_client(), worker
+            ).unwrap()
+            if docker_container is None:
+                raise SyftException(
+                    public_message=f"Worker {worker.id} container not found."
+                )
+            try:
+                # let docker cut the log down instead of sending the whole history
+                logs = cast(
+                    bytes, docker_container.logs(tail="all" if tail is None else tail)
+                )
+            except docker.errors.APIError as e:
+                raise SyftException(
+                    public_message=f"Failed to get worker {worker.id} container logs. Error {e}"
+                )
 
         return logs if raw else logs.decode(errors="ignore")
 
@@ -156,32 +180,100 @@ class WorkerService(AbstractService):
             )
         elif not context.server.in_memory_workers:
             # delete the worker using docker client sdk
-            with contextlib.closing(docker.from_env()) as client:
-                docker_container = _get_worker_container(client, worker).unwrap()
-                _stop_worker_container(worker, docker_container, force=force).unwrap()
+            _stop_and_remove_worker(worker, force=force).unwrap()
         else:
             # kill the in memory worker thread
             context.server.remove_consumer_with_id(syft_worker_id=worker.id)
 
-        # remove the worker from the pool
-        try:
-            worker_linked_object = next(
-                obj for obj in worker_pool.worker_list if obj.object_uid == uid
-            )
-            worker_pool.worker_list.remove(worker_linked_object)
-        except StopIteration:
-            pass
+        # remove the worker from the pool, matching on the uid avoids the
+        # field by field LinkedObject comparison of list.remove
+        worker_list = [obj for obj in worker_pool.worker_list if obj.object_uid != uid]
+        pool_changed = len(worker_list) != len(worker_pool.worker_list)
 
         # Delete worker from worker stash
         self.stash.delete_by_uid(credentials=context.credentials, uid=uid).unwrap()
 
-        # Update worker pool
-        worker_pool_stash.update(context.credentials, obj=worker_pool).unwrap()
+        # Update worker pool, unless the worker was not part of it
+        if pool_changed:
+            worker_pool.worker_list = worker_list
+            worker_pool_stash.update(context.credentials, obj=worker_pool).unwrap()
 
         return SyftSuccess(
             message=f"Worker with id: {uid} deleted successfully from pool: {worker_pool.name}"
         )
 
+    def _delete_workers(
+        self,
+        context: AuthedServiceContext,
+        workers: Sequence[SyftWorker],
+        force: bool = False,
+    ) -> None:
+        """Delete several workers, their containers are stopped concurrently."""
+        # mark the workers first, like delete does, so workers left behind by
+        # a failed removal still show that they are being deleted
+        for worker in workers:
+            worker.to_be_deleted = True
+            self.stash.update(context.credentials, worker).unwrap()
+
+        if IN_KUBERNETES or context.server.in_memory_workers:
+            for worker in workers:
+                self._delete(context, worker, force=force)
+            return
+
+        if force:
+            for worker in workers:
+                if worker.job_id is not None:
+                    context.server.services.job.kill(context=context, id=worker.job_id)
+
+        removed: list[SyftWorker] = []
+        errors: list[Exception] = []
+        if workers:
+            # stopping a container blocks on docker, run them side by side
+            max_workers = min(DOCKER_CLIENT_MAX_THREADS, len(workers))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _stop_and_remove_worker, worker, force=force
+                    ): worker
+                    for worker in workers
+                }
+                for future in as_completed(futures):
+                    worker = futures[future]
+                    try:
+                        # docker and requests errors are not wrapped in a Result
+                        future.result().unwrap()
+                    except Exception as e:
+                        logger.error(f"Failed to remove worker {worker.id}: {e}")
+                        errors.append(e)
+                    else:
+                        removed.append(worker)
+
+        uids_by_pool: dict[str, set[UID]] = defaultdict(set)
+        for worker in removed:
+            uids_by_pool[worker.worker_pool_name].add(worker.id)
+
+        worker_pool_stash = context.server.services.syft_worker_pool.stash
+        for pool_name, uids in uids_by_pool.items():
+            worker_pool = worker_pool_stash.get_by_name(
+                credentials=context.credentials, pool_name=pool_name
+            ).unwrap()
+            worker_list = [
+                obj for obj in worker_pool.worker_list if obj.object_uid not in uids
+            ]
+            for uid in uids:
+                self.stash.delete_by_uid(
+                    credentials=context.credentials, uid=uid
+                ).unwrap()
+            if len(worker_list) != len(worker_pool.worker_list):
+                worker_pool.worker_list = worker_list
+                worker_pool_stash.update(
+                    credentials=context.credentials, obj=worker_pool
+                ).unwrap()
+
+        # the removed workers are cleaned up, surface the first failure
+        if errors:
+            raise errors[0]
+
     @service_method(
         path="worker.delete",
         name="delete",
@@ -250,15 +342,25 @@ def refresh_status_kubernetes(workers: list[SyftWorker]) -> list[SyftWorker]:
 @as_result(SyftException)
 def refresh_status_docker(workers: list[SyftWorker]) -> list[SyftWorker]:
     updated_workers = []
-    with contextlib.closing(docker.from_env()) as client:
-        for worker in workers:
-            status = _get_worker_container_status(client, worker).unwrap()
-            worker.status = status
-            worker.healthcheck = _get_healthcheck_based_on_status(status=status)
-            updated_workers.append(worker)
+    client = get_docker_client()
+    for worker in workers:
+        status = _get_worker_container_status(client, worker).unwrap()
+        worker.status = status
+        worker.healthcheck = _get_healthcheck_based_on_status(status=status)
+        updated_workers.append(worker)
     return updated_workers
 
 
+@as_result(SyftException)
+def _stop_and_remove_worker(worker: SyftWorker, force: bool) -> None:
+    docker_container = _get_worker_container(get_docker_client(), worker).unwrap()
+    if docker_container is None:
+        # already gone, the caller still removes the worker records
+        logger.info(f"Container of worker {worker.id} not found, skipping removal")
+        return None
+    _stop_worker_container(worker, docker_container, force=force).unwrap()
+
+
 @as_result(SyftException)
 def _stop_worker_container(
     worker: SyftWorker,
@@ -266,9 +368,11 @@ def _stop_worker_container(
     force: bool,
 ) -> None:
     try:
-        # stop the container
-        container.stop()
-        # Remove the container and its volumes
+        if not force:
+            # graceful stop, docker waits for the container before killing it
+            container.stop()
+        # Remove the container and its volumes, a forced removal kills
+        # the container right away
         _remove_worker_container(container, force=force, v=True)
         return None
     except Exception as e:
@@ -279,10 +383,18 @@ def _stop_worker_container(
 
 def _remove_worker_container(container: Container, **kwargs: Any) -> None:
     try:
-        container.remove(**kwargs)
+        try:
+            container.remove(**kwargs)
+        except docker.errors.APIError as e:
+            # 409 is also returned for other conflicts, e.g. a running
+            # container, only wait if docker is already removing it
+            if e.status_code != 409:
+                raise
+            container.reload()
+            if container.status != "removing":
+                raise
+        # removal finishes asynchronously, block until docker reports it done
+        container.wait(condition="removed", timeout=WORKER_CONTAINER_REMOVE_TIMEOUT_SEC)
     except docker.errors.NotFound:
+        # the container is already gone
         return
-    except docker.errors.APIError as e:
-        if "removal of container" in str(e) and "is already in progress" in str(e):
-            # If the container is already being removed, ignore the error
-            return
@@ -53,9 +53,18 @@ class WorkerStash(ObjectStash[SyftWorker]):
         )
 
     @as_result(StashException, NotFoundException)
+    @with_session
     def update_consumer_state(
-        self, credentials: SyftVerifyKey, worker_uid: UID, consumer_state: ConsumerState
+        self,
+        credentials: SyftVerifyKey,
+        worker_uid: UID,
+        consumer_state: ConsumerState,
+        session: Session = None,
     ) -> SyftWorker:
-        worker = self.get_by_uid(credentials=credentials, uid=worker_uid).unwrap()
+        worker = self.get_by_uid(
+            credentials=credentials, uid=worker_uid, session=session
+        ).unwrap()
         worker.consumer_state = consumer_state
-        return self.update(credentials=credentials, obj=worker).unwrap()
+        return self.update(
+            credentials=credentials, obj=worker, session=session
+        ).unwrap()
@@ -1,6 +1,7 @@
 # stdlib
 import logging
 from pathlib import Path
+from typing import Any
 from typing import Generic
 from typing import TypeVar
 from urllib.parse import urlparse
@@ -28,6 +29,11 @@ class DBConfig(BaseModel):
     def connection_string(self) -> str:
         raise NotImplementedError("Subclasses must implement this method.")
 
+    @property
+    def engine_kwargs(self) -> dict[str, Any]:
+        """Extra keyword arguments for `sqlalchemy.create_engine`."""
+        return {}
+
     @classmethod
     def from_connection_string(cls, conn_str: str) -> "DBConfig":
         # relative
@@ -67,6 +73,7 @@ class DBManager(Generic[ConfigT]):
             config.connection_string,
             # json_serializer=dumps,
             # json_deserializer=loads,
+            **config.engine_kwargs,
         )
         logger.info(f"Connecting to {config.connection_string}")
         self.sessionmaker = sessionmaker(bind=self.engine)
@@ -79,7 +86,8 @@ class DBManager(Generic[ConfigT]):
     def init_tables(self, reset: bool = False) -> None:
         Base = SQLiteBase if self.engine.dialect.name == "sqlite" else PostgresBase
 
-        with self.sessionmaker().begin() as _:
+        # one connection and transaction for the whole schema setup
+        with self.engine.begin() as connection:
             if reset:
-                Base.metadata.drop_all(bind=self.engine)
-            Base.metadata.create_all(self.engine)
+                Base.metadata.drop_all(bind=connection)
+            Base.metadata.create_all(bind=connection, checkfirst=True)
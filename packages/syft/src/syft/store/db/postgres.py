@@ -1,3 +1,6 @@
+# stdlib
+from typing import Any
+
 # third party
 from sqlalchemy import URL
 
@@ -16,6 +19,19 @@ class PostgresDBConfig(DBConfig):
     user: str
     password: str
     database: str
+    # connection pool of each server process, worker containers have their own
+    pool_size: int = 10
+    max_overflow: int = 20
+    # check connections on checkout, the database may have dropped idle ones
+    pool_pre_ping: bool = True
+
+    @property
+    def engine_kwargs(self) -> dict[str, Any]:
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
 
     @property
     def connection_string(self) -> str:
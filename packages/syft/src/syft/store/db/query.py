@@ -264,6 +264,22 @@ class Query(ABC):
         self.stmt = self.stmt.offset(offset)
         return self
 
+    def select(self, *fields: str) -> Self:
+        """Only select the given fields instead of the full row.
+
+        example usage:
+        Query(User).filter("email", "eq", email).select("id")
+
+        Args:
+            *fields (str): Fields to select
+
+        Returns:
+            Self: The query object selecting only the given fields
+        """
+        columns = [self._get_column(field) for field in fields]
+        self.stmt = self.stmt.with_only_columns(*columns)
+        return self
+
     @abstractmethod
     def _make_permissions_clause(
         self,
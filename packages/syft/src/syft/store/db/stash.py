@@ -1,7 +1,9 @@
 # stdlib
+from collections import OrderedDict
 from collections.abc import Callable
 from functools import wraps
 import inspect
+import threading
 from typing import Any
 from typing import Generic
 from typing import ParamSpec
@@ -100,12 +102,16 @@ def with_session(func: Callable[P, T]) -> Callable[P, T]:  # type: ignore
 @instrument
 class ObjectStash(Generic[StashT]):
     allow_any_type: bool = False
+    # Number of deserialized objects to keep in memory, 0 disables the cache
+    object_cache_size: int = 0
 
     def __init__(self, store: DBManager) -> None:
         self.db = store
         self.object_type = self.get_object_type()
         self.table = create_table(self.object_type, self.dialect)
         self.sessionmaker: Callable[[], Session] = self.db.sessionmaker
+        self._object_cache: OrderedDict[UID, tuple[dict, StashT]] = OrderedDict()
+        self._object_cache_lock = threading.Lock()
 
     @property
     def dialect(self) -> sa.engine.interfaces.Dialect:
@@ -280,7 +286,32 @@ class ObjectStash(Generic[StashT]):
 
     def row_as_obj(self, row: Row) -> StashT:
         # TODO make unwrappable serde
-        return deserialize_json(row.fields)
+        if not self.object_cache_size:
+            return deserialize_json(row.fields)
+        return self._cached_row_as_obj(row)
+
+    def _cached_row_as_obj(self, row: Row) -> StashT:
+        """
+        Deserialize a row, reusing a previously deserialized object if the stored
+        fields did not change. The database stays the source of truth: a cache hit
+        requires the cached fields to be equal to the fields of the row.
+
+        Callers are free to mutate the returned object, so the cache only ever
+        hands out copies.
+        """
+        with self._object_cache_lock:
+            cached = self._object_cache.get(row.id)
+            if cached is not None and cached[0] == row.fields:
+                self._object_cache.move_to_end(row.id)
+                return cached[1].model_copy(deep=True)
+
+        obj = deserialize_json(row.fields)
+        with self._object_cache_lock:
+            self._object_cache[row.id] = (row.fields, obj.model_copy(deep=True))
+            self._object_cache.move_to_end(row.id)
+            while len(self._object_cache) > self.object_cache_size:
+                self._object_cache.popitem(last=False)
+        return obj
 
     @with_session
     def get_role(
@@ -515,6 +546,8 @@ class ObjectStash(Generic[StashT]):
             raise NotFoundException(
                 f"{self.object_type.__name__}: {uid} not found or no permission to delete."
             )
+        with self._object_cache_lock:
+            self._object_cache.pop(uid, None)
         return uid
 
     @as_result(StashException)
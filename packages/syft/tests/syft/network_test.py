@@ -1,6 +1,8 @@
 # syft absolute
 from syft.abstract_server import ServerType
 from syft.server.credentials import SyftSigningKey
+from syft.service.action.action_permissions import ActionObjectPermission
+from syft.service.action.action_permissions import ActionPermission
 from syft.service.network.network_service import NetworkStash
 from syft.service.network.server_peer import ServerPeer
 from syft.service.network.server_peer import ServerPeerUpdate
@@ -29,3 +31,66 @@ def test_add_route() -> None:
     ).unwrap()
 
     assert peer.name == "new name"
+
+
+def make_peer(name: str) -> ServerPeer:
+    return ServerPeer(
+        id=UID(),
+        name=name,
+        verify_key=SyftSigningKey.generate().verify_key,
+        server_type=ServerType.DATASITE,
+        admin_email="info@openmined.org",
+    )
+
+
+def test_get_by_verify_keys() -> None:
+    network_stash = NetworkStash.random()
+    root_verify_key = network_stash.db.root_verify_key
+    peers = [make_peer(f"peer-{i}") for i in range(3)]
+    for peer in peers:
+        network_stash.set(credentials=root_verify_key, obj=peer).unwrap()
+
+    missing_key = SyftSigningKey.generate().verify_key
+    result = network_stash.get_by_verify_keys(
+        credentials=root_verify_key,
+        verify_keys=[peers[0].verify_key, peers[2].verify_key, missing_key],
+    ).unwrap()
+
+    # keys without a peer are left out
+    assert set(result) == {peers[0].verify_key, peers[2].verify_key}
+    assert result[peers[0].verify_key].id == peers[0].id
+    assert result[peers[2].verify_key].id == peers[2].id
+
+    assert (
+        network_stash.get_by_verify_keys(
+            credentials=root_verify_key, verify_keys=[]
+        ).unwrap()
+        == {}
+    )
+
+
+def test_get_by_verify_keys_permissions() -> None:
+    network_stash = NetworkStash.random()
+    root_verify_key = network_stash.db.root_verify_key
+    guest_verify_key = SyftSigningKey.generate().verify_key
+    readable, unreadable = make_peer("readable"), make_peer("unreadable")
+
+    network_stash.set(
+        credentials=root_verify_key,
+        obj=readable,
+        add_permissions=[
+            ActionObjectPermission(
+                uid=readable.id,
+                permission=ActionPermission.READ,
+                credentials=guest_verify_key,
+            )
+        ],
+    ).unwrap()
+    network_stash.set(credentials=root_verify_key, obj=unreadable).unwrap()
+
+    # peers the user cannot read are left out
+    result = network_stash.get_by_verify_keys(
+        credentials=guest_verify_key,
+        verify_keys=[readable.verify_key, unreadable.verify_key],
+    ).unwrap()
+    assert set(result) == {readable.verify_key}
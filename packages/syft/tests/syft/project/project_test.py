@@ -1,10 +1,21 @@
+# stdlib
+from types import SimpleNamespace
+
 # third party
 from pydantic import ValidationError
 import pytest
 
 # syft absolute
 import syft as sy
+from syft.abstract_server import ServerType
+from syft.server.credentials import SyftSigningKey
+from syft.service.context import AuthedServiceContext
+from syft.service.network.server_peer import ServerPeer
 from syft.service.project.project import Project
+from syft.types.errors import SyftException
+from syft.types.result import Ok
+from syft.types.result import as_result
+from syft.types.uid import UID
 
 
 def test_project_creation(worker):
@@ -110,3 +121,100 @@ def test_project_serde(worker):
     deser_data = sy.deserialize(ser_data, from_bytes=True)
     assert isinstance(deser_data, type(project))
     assert deser_data == project
+
+
+def test_project_get_all_paginated(worker):
+    root_client = worker.root_client
+
+    names = [f"Project {i}" for i in range(5)]
+    for name in names:
+        sy.Project(
+            name=name, description="My Cool Description", members=[root_client]
+        ).send()
+
+    all_projects = root_client.api.services.project.get_all()
+    assert len(all_projects) == len(names)
+
+    first_page = root_client.api.services.project.get_all(page_size=2)
+    second_page = root_client.api.services.project.get_all(page_size=2, page_index=1)
+    last_page = root_client.api.services.project.get_all(page_size=2, page_index=2)
+    assert [p.id for p in first_page + second_page + last_page] == [
+        p.id for p in all_projects
+    ]
+    assert len(last_page) == 1
+
+
+def test_broadcast_event_failing_peer(worker, monkeypatch):
+    project_service = worker.services.project
+    network_stash = worker.services.network.stash
+
+    peers = [
+        ServerPeer(
+            id=UID(),
+            name=f"peer-{i}",
+            verify_key=SyftSigningKey.generate().verify_key,
+            server_type=ServerType.DATASITE,
+            admin_email="info@openmined.org",
+        )
+        for i in range(3)
+    ]
+    for peer in peers:
+        network_stash.set(credentials=worker.verify_key, obj=peer).unwrap()
+    failing = peers[1]
+
+    project_event = SimpleNamespace(id=UID(), project_id=UID(), seq_no=1)
+    project = SimpleNamespace(
+        name="My Cool Project",
+        events=[],
+        event_id_hashmap={},
+        members=[
+            SimpleNamespace(verify_key=peer.verify_key, name=peer.name, id=peer.id)
+            for peer in peers
+        ],
+    )
+
+    # the leader owns the project, skip its validation and storage
+    @as_result(SyftException)
+    def valid(*args, **kwargs) -> None:
+        return None
+
+    for name in [
+        "validate_project_leader",
+        "validate_user_permission_for_project",
+        "validate_project_event_seq",
+        "check_for_project_request",
+    ]:
+        monkeypatch.setattr(project_service, name, valid)
+    monkeypatch.setattr(
+        project_service,
+        "stash",
+        SimpleNamespace(
+            get_by_uid=lambda *args, **kwargs: Ok(project),
+            update=lambda *args, **kwargs: Ok(project),
+        ),
+    )
+
+    received = []
+
+    def add_event(peer, event):
+        if peer.id == failing.id:
+            raise SyftException(public_message=f"{peer.name} is unreachable")
+        received.append((peer.id, event.id))
+
+    @as_result(SyftException)
+    def client_with_context(peer, context):
+        project_api = SimpleNamespace(add_event=lambda event: add_event(peer, event))
+        return SimpleNamespace(
+            api=SimpleNamespace(services=SimpleNamespace(project=project_api))
+        )
+
+    monkeypatch.setattr(ServerPeer, "client_with_context", client_with_context)
+
+    context = AuthedServiceContext(server=worker, credentials=worker.verify_key)
+    with pytest.raises(SyftException, match="unreachable"):
+        project_service.broadcast_event(context, project_event)
+
+    # the failing peer does not keep the event from the others
+    assert sorted(received) == sorted(
+        (peer.id, project_event.id) for peer in peers if peer.id != failing.id
+    )
@@ -25,3 +25,23 @@ def test_action_service_sanity(worker):
     assert len(service.stash._data) == 1
     res = pointer.capitalize()
     assert res[0] == "A"
+
+
+def test_action_service_unwrap_nested_actionobjects(worker):
+    service = worker.services.action
+    root_datasite_client = worker.root_client
+    ctx = get_auth_ctx(worker)
+
+    obj = ActionObject.from_obj("abc")
+    obj.send(root_datasite_client)
+
+    data = [1, {"a": 2}]
+    unwrapped, found = service.unwrap_nested_actionobjects(ctx, data)
+    assert not found
+    assert unwrapped is data
+
+    unwrapped, found = service.unwrap_nested_actionobjects(
+        ctx, [1, {"a": obj, "b": [obj]}]
+    )
+    assert found
+    assert unwrapped == [1, {"a": "abc", "b": ["abc"]}]
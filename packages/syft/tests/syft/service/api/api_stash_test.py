@@ -0,0 +1,54 @@
+# syft absolute
+import syft as sy
+from syft.service.action.action_permissions import ActionObjectPermission
+from syft.service.action.action_permissions import ActionPermission
+from syft.service.response import SyftSuccess
+
+
+@sy.api_endpoint_method()
+def private_query_function(context, query_str: str) -> str:
+    return query_str
+
+
+@sy.api_endpoint_method()
+def mock_query_function(context, query_str: str) -> str:
+    return query_str
+
+
+def add_endpoint(worker, path: str) -> None:
+    new_endpoint = sy.TwinAPIEndpoint(
+        path=path,
+        description="Test",
+        private_function=private_query_function,
+        mock_function=mock_query_function,
+    )
+    res = worker.root_client.api.services.api.add(endpoint=new_endpoint)
+    assert isinstance(res, SyftSuccess)
+
+
+def test_path_exists(worker, root_verify_key) -> None:
+    stash = worker.services.api.stash
+    add_endpoint(worker, "test.test_query")
+
+    assert stash.path_exists(root_verify_key, "test.test_query").unwrap()
+    assert not stash.path_exists(root_verify_key, "test.missing").unwrap()
+
+
+def test_path_exists_permissions(worker, ds_verify_key) -> None:
+    stash = worker.services.api.stash
+    add_endpoint(worker, "test.test_query")
+
+    # endpoints the user cannot read are treated as missing
+    assert not stash.path_exists(ds_verify_key, "test.test_query").unwrap()
+
+    endpoint = stash.get_by_path(stash.root_verify_key, "test.test_query").unwrap()
+    stash.add_permission(
+        ActionObjectPermission(
+            uid=endpoint.id,
+            permission=ActionPermission.READ,
+            credentials=ds_verify_key,
+        )
+    ).unwrap()
+
+    assert stash.path_exists(ds_verify_key, "test.test_query").unwrap()
+    assert not stash.path_exists(ds_verify_key, "test.missing").unwrap()
@@ -146,3 +146,24 @@ def test_action_store_test_dataset_get(stash: ActionObjectStash) -> None:
     stash.delete_by_uid(client_key, data_uid)
     res = stash.get(data_uid, client_key)
     assert res.is_err()
+
+
+@pytest.mark.parametrize(
+    "stash",
+    [
+        pytest.lazy_fixture("action_object_stash"),
+    ],
+)
+def test_action_store_get_many(stash: ActionObjectStash) -> None:
+    client_key = add_user(stash.db, ServiceRole.DATA_SCIENTIST)
+    hacker_key = add_user(stash.db, ServiceRole.DATA_SCIENTIST)
+
+    uids = [add_test_object(stash, client_key) for _ in range(3)]
+
+    objs = stash.get_many(uids=uids + uids[:1], credentials=client_key).unwrap()
+    assert set(objs.keys()) == set(uids)
+    assert all(objs[uid].id == uid for uid in uids)
+
+    assert stash.get_many(uids=uids, credentials=hacker_key).is_err()
+    assert stash.get_many(uids=[*uids, UID()], credentials=client_key).is_err()
+    assert stash.get_many(uids=[], credentials=client_key).unwrap() == {}
@@ -447,3 +447,28 @@ def test_stash_thread_support(
 
     result = base_stash.get_by_uid(root_verify_key, mock_object.id).unwrap()
     assert result == mock_object
+
+
+def test_stash_object_cache(
+    root_verify_key, base_stash: MockStash, mock_object: MockObject
+) -> None:
+    base_stash.object_cache_size = 1
+    base_stash.set(root_verify_key, mock_object).unwrap()
+
+    first = base_stash.get_by_uid(root_verify_key, mock_object.id).unwrap()
+    assert mock_object.id in base_stash._object_cache
+
+    # returned objects are copies, mutating them does not affect the cache
+    first.desc = "mutated"
+    second = base_stash.get_by_uid(root_verify_key, mock_object.id).unwrap()
+    assert second == mock_object
+    assert second is not first
+
+    # updates in the database invalidate the cached object
+    second.value += 1
+    base_stash.update(root_verify_key, second).unwrap()
+    third = base_stash.get_by_uid(root_verify_key, mock_object.id).unwrap()
+    assert third.value == mock_object.value + 1
+
+    base_stash.delete_by_uid(root_verify_key, mock_object.id).unwrap()
+    assert mock_object.id not in base_stash._object_cache
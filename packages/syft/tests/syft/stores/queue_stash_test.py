@@ -7,6 +7,7 @@ import pytest
 # syft absolute
 from syft.service.queue.queue_stash import QueueItem
 from syft.service.queue.queue_stash import QueueStash
+from syft.service.queue.queue_stash import Status
 from syft.service.worker.worker_pool import WorkerPool
 from syft.service.worker.worker_pool_service import SyftWorkerPoolService
 from syft.store.linked_obj import LinkedObject
@@ -108,6 +109,35 @@ def test_queue_stash_update(queue: QueueStash) -> None:
     assert len(queue) == 0
 
 
+@pytest.mark.parametrize(
+    "queue",
+    [
+        pytest.lazy_fixture("queue_stash"),
+    ],
+)
+def test_queue_stash_get_by_statuses(queue: QueueStash) -> None:
+    root_verify_key = queue.db.root_verify_key
+    statuses = [Status.CREATED, Status.PROCESSING, Status.COMPLETED, Status.CREATED]
+    objs = []
+    for status in statuses:
+        obj = mock_queue_object()
+        obj.status = status
+        queue.set(root_verify_key, obj, ignore_duplicates=False).unwrap()
+        objs.append(obj)
+
+    items = queue.get_by_statuses(
+        root_verify_key, statuses=[Status.CREATED, Status.PROCESSING]
+    ).unwrap()
+
+    assert set(items) == {Status.CREATED, Status.PROCESSING}
+    for status, status_items in items.items():
+        expected = {obj.id for obj in objs if obj.status == status}
+        assert {item.id for item in status_items} == expected
+        assert all(item.status == status for item in status_items)
+
+    assert queue.get_by_statuses(root_verify_key, statuses=[]).unwrap() == {}
+
+
 @pytest.mark.parametrize(
     "queue",
     [
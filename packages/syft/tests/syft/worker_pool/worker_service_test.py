@@ -0,0 +1,184 @@
+# stdlib
+from secrets import token_hex
+
+# third party
+import docker
+import pytest
+import requests
+
+# syft absolute
+from syft.service.context import AuthedServiceContext
+from syft.service.worker import worker_service
+from syft.service.worker.worker_pool import SyftWorker
+from syft.service.worker.worker_pool import WorkerPool
+from syft.service.worker.worker_pool import WorkerStatus
+from syft.service.worker.worker_service import WorkerService
+from syft.service.worker.worker_service import _remove_worker_container
+from syft.store.linked_obj import LinkedObject
+from syft.types.errors import SyftException
+from syft.types.result import as_result
+from syft.types.uid import UID
+
+
+def api_error(status_code: int, explanation: str) -> docker.errors.APIError:
+    response = requests.Response()
+    response.status_code = status_code
+    return docker.errors.APIError(explanation, response=response)
+
+
+class FakeContainers:
+    def get(self, container_id: str):
+        raise docker.errors.NotFound(f"No such container: {container_id}")
+
+
+class FakeDockerClient:
+    containers = FakeContainers()
+
+
+class FakeContainer:
+    def __init__(
+        self,
+        status: str = "exited",
+        remove_error: Exception | None = None,
+        reload_error: Exception | None = None,
+    ) -> None:
+        self.status = status
+        self.remove_error = remove_error
+        self.reload_error = reload_error
+        self.waited = False
+
+    def remove(self, **kwargs):
+        if self.remove_error is not None:
+            raise self.remove_error
+
+    def reload(self):
+        if self.reload_error is not None:
+            raise self.reload_error
+
+    def wait(self, **kwargs):
+        self.waited = True
+
+
+def test_remove_worker_container_waits_for_removal() -> None:
+    container = FakeContainer()
+    _remove_worker_container(container, force=True)
+    assert container.waited
+
+
+def test_remove_worker_container_waits_when_removal_in_progress() -> None:
+    container = FakeContainer(
+        status="removing",
+        remove_error=api_error(409, "removal of container is already in progress"),
+    )
+    _remove_worker_container(container, force=True)
+    assert container.waited
+
+
+def test_remove_worker_container_fails_fast_on_other_conflicts() -> None:
+    container = FakeContainer(
+        status="running",
+        remove_error=api_error(409, "cannot remove a running container"),
+    )
+    with pytest.raises(docker.errors.APIError):
+        _remove_worker_container(container, force=False)
+    assert not container.waited
+
+
+def test_remove_worker_container_already_gone() -> None:
+    container = FakeContainer(
+        remove_error=api_error(409, "removal of container is already in progress"),
+        reload_error=docker.errors.NotFound("no such container"),
+    )
+    _remove_worker_container(container, force=True)
+    assert not container.waited
+
+
+def add_worker_pool(server, n_workers: int) -> list[SyftWorker]:
+    credentials = server.verify_key
+    pool_name = token_hex(8)
+    workers = [
+        SyftWorker(
+            id=UID(),
+            name=token_hex(8),
+            container_id=token_hex(8),
+            status=WorkerStatus.RUNNING,
+            worker_pool_name=pool_name,
+        )
+        for _ in range(n_workers)
+    ]
+    for worker in workers:
+        server.services.worker.stash.set(credentials, worker).unwrap()
+
+    worker_pool = WorkerPool(
+        name=pool_name,
+        max_count=n_workers,
+        worker_list=[
+            LinkedObject.from_obj(
+                obj=worker, service_type=WorkerService, server_uid=server.id
+            )
+            for worker in workers
+        ],
+    )
+    server.services.syft_worker_pool.stash.set(credentials, worker_pool).unwrap()
+    return workers
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        SyftException(public_message="Failed to remove container"),
+        # docker errors are not wrapped in a Result
+        api_error(500, "Internal Server Error"),
+    ],
+)
+def test_delete_workers_partial_failure(worker, monkeypatch, error) -> None:
+    workers = add_worker_pool(worker, n_workers=3)
+    failing = workers[1]
+
+    @as_result(SyftException)
+    def stop_and_remove_worker(syft_worker: SyftWorker, force: bool = False) -> None:
+        if syft_worker.id == failing.id:
+            raise error
+
+    # delete the workers as docker containers
+    monkeypatch.setattr(worker, "in_memory_workers", False)
+    monkeypatch.setattr(
+        worker_service, "_stop_and_remove_worker", stop_and_remove_worker
+    )
+
+    context = AuthedServiceContext(server=worker, credentials=worker.verify_key)
+    with pytest.raises(type(error)):
+        worker.services.worker._delete_workers(context, workers, force=True)
+
+    # the other workers are still cleaned up
+    worker_stash = worker.services.worker.stash
+    remaining = worker_stash.get_all(worker.verify_key).unwrap()
+    assert [w.id for w in remaining] == [failing.id]
+    # the worker left behind shows that it is being deleted
+    assert remaining[0].to_be_deleted
+
+    worker_pool = worker.services.syft_worker_pool.stash.get_by_name(
+        worker.verify_key, pool_name=failing.worker_pool_name
+    ).unwrap()
+    assert [obj.object_uid for obj in worker_pool.worker_list] == [failing.id]
+
+
+def test_delete_worker_container_gone(worker, monkeypatch) -> None:
+    workers = add_worker_pool(worker, n_workers=2)
+    deleted = workers[0]
+
+    monkeypatch.setattr(worker, "in_memory_workers", False)
+    monkeypatch.setattr(worker_service, "get_docker_client", FakeDockerClient)
+
+    context = AuthedServiceContext(server=worker, credentials=worker.verify_key)
+    worker.services.worker._delete(context, deleted, force=True)
+
+    worker_stash = worker.services.worker.stash
+    remaining = {w.id for w in worker_stash.get_all(worker.verify_key).unwrap()}
+    assert deleted.id not in remaining
+    assert workers[1].id in remaining
+
+    worker_pool = worker.services.syft_worker_pool.stash.get_by_name(
+        worker.verify_key, pool_name=deleted.worker_pool_name
+    ).unwrap()
+    assert [obj.object_uid for obj in worker_pool.worker_list] == [workers[1].id]
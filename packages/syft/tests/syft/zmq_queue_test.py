@@ -2,24 +2,41 @@
 from collections import defaultdict
 from secrets import token_hex
 import sys
+import threading
 from time import sleep
+from time import time
+from types import SimpleNamespace
 
 # third party
 from faker import Faker
 import pytest
+import zmq
 from zmq import Socket
 
 # syft absolute
 import syft
+from syft.service.context import AuthedServiceContext
 from syft.service.queue.base_queue import AbstractMessageHandler
 from syft.service.queue.queue import QueueManager
+from syft.service.queue.queue_stash import Status
 from syft.service.queue.zmq_client import ZMQClient
 from syft.service.queue.zmq_client import ZMQClientConfig
 from syft.service.queue.zmq_client import ZMQQueueConfig
+from syft.service.queue.zmq_common import CONSUMER_STATE_FLUSH_INTERVAL_SEC
+from syft.service.queue.zmq_common import Service
+from syft.service.queue.zmq_common import Worker
+from syft.service.queue.zmq_common import ZMQCommand
+from syft.service.queue.zmq_common import ZMQHeader
+from syft.service.queue.zmq_common import ZMQ_POLLER_TIMEOUT_MSEC
 from syft.service.queue.zmq_consumer import ZMQConsumer
 from syft.service.queue.zmq_producer import ZMQProducer
 from syft.service.response import SyftSuccess
+from syft.service.worker.worker_pool import ConsumerState
+from syft.service.worker.worker_pool import SyftWorker
+from syft.service.worker.worker_pool import WorkerStatus
 from syft.types.errors import SyftException
+from syft.types.result import Ok
+from syft.types.uid import UID
 from syft.util.util import get_queue_address
 from syft.util.util import get_random_available_port
 
@@ -203,6 +220,225 @@ def test_zmq_pub_sub(faker: Faker, producer, consumer):
     assert consumer.alive is False
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+def test_zmq_producer_drains_all_messages_per_poll(producer) -> None:
+    polls = 0
+    processed = []
+
+    class CountingPoller:
+        def __init__(self, poller: zmq.Poller) -> None:
+            self.poller = poller
+
+        def poll(self, timeout: int) -> list:
+            nonlocal polls
+            polls += 1
+            return self.poller.poll(timeout)
+
+    producer.poll_workers = CountingPoller(producer.poll_workers)
+    producer.process_message = lambda msg: processed.append((polls, msg))
+
+    context = zmq.Context()
+    socket = context.socket(zmq.DEALER)
+    socket.setsockopt(zmq.LINGER, 0)
+    socket.connect(producer.address)
+    try:
+        n_messages = 5
+        for i in range(n_messages):
+            socket.send_multipart(
+                [b"", ZMQHeader.W_WORKER, ZMQCommand.W_HEARTBEAT, str(i).encode()]
+            )
+        # let every message reach the producer socket before its first poll
+        sleep(0.5)
+
+        producer.thread = threading.Thread(target=producer._run, daemon=True)
+        producer.thread.start()
+        sleep(0.5)
+    finally:
+        socket.close()
+        context.term()
+
+    assert [msg[-1] for _, msg in processed] == [
+        str(i).encode() for i in range(n_messages)
+    ]
+    # all queued messages are handled after a single poll
+    assert {poll for poll, _ in processed} == {1}
+
+
+@pytest.fixture
+def stateful_producer():
+    # the state flusher writes from its own thread, which needs a db shared
+    # between connections, unlike in-memory sqlite
+    server = syft.Worker.named(name=token_hex(16), reset=True)
+    worker_stash = server.services.worker.stash
+    context = AuthedServiceContext(server=server, credentials=server.verify_key)
+    producer = ZMQProducer(
+        port=get_random_available_port(),
+        queue_name=token_hex(8),
+        queue_stash=None,
+        worker_stash=worker_stash,
+        context=context,
+    )
+    # only run the consumer state flusher, no messages are exchanged
+    producer.state_thread = threading.Thread(
+        target=producer.flush_consumer_states, daemon=True
+    )
+    producer.state_thread.start()
+    yield producer
+    if producer.alive:
+        producer.close()
+    server.cleanup()
+
+
+def _add_syft_worker(producer: ZMQProducer, service: Service) -> Worker:
+    syft_worker = SyftWorker(
+        id=UID(),
+        name=token_hex(8),
+        status=WorkerStatus.RUNNING,
+        worker_pool_name="default-pool",
+    )
+    worker_stash = producer.worker_stash
+    worker_stash.set(worker_stash.root_verify_key, syft_worker).unwrap()
+    identity = token_hex(8).encode()
+    return Worker(
+        address=identity,
+        identity=identity,
+        service=service,
+        syft_worker_id=syft_worker.id,
+    )
+
+
+def _consumer_state(producer: ZMQProducer, worker: Worker) -> ConsumerState:
+    worker_stash = producer.worker_stash
+    return (
+        worker_stash.get_by_uid(worker_stash.root_verify_key, worker.syft_worker_id)
+        .unwrap()
+        .consumer_state
+    )
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+def test_zmq_producer_flushes_idle_state(stateful_producer) -> None:
+    service = Service("my-service")
+    worker = _add_syft_worker(stateful_producer, service)
+
+    stateful_producer.worker_waiting(worker)
+    sleep(CONSUMER_STATE_FLUSH_INTERVAL_SEC * 5)
+
+    assert _consumer_state(stateful_producer, worker) == ConsumerState.IDLE
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+def test_zmq_producer_keeps_consuming_state_on_dispatch(stateful_producer) -> None:
+    service = Service("my-service")
+    service.requests.append(b"request")
+    worker = _add_syft_worker(stateful_producer, service)
+
+    # the worker is handed the request right away
+    stateful_producer.worker_waiting(worker)
+    assert not service.requests
+
+    # the consumer writes its own state as soon as it takes the request
+    worker_stash = stateful_producer.worker_stash
+    worker_stash.update_consumer_state(
+        credentials=worker_stash.root_verify_key,
+        worker_uid=worker.syft_worker_id,
+        consumer_state=ConsumerState.CONSUMING,
+    ).unwrap()
+    sleep(CONSUMER_STATE_FLUSH_INTERVAL_SEC * 5)
+
+    # the IDLE state queued before the dispatch must not overwrite it
+    assert _consumer_state(stateful_producer, worker) == ConsumerState.CONSUMING
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+def test_zmq_producer_writes_states_outside_the_lock(stateful_producer) -> None:
+    service = Service("my-service")
+    worker = _add_syft_worker(stateful_producer, service)
+    dispatched_worker = _add_syft_worker(stateful_producer, service)
+
+    writing = threading.Event()
+    release = threading.Event()
+    written = []
+    worker_stash = stateful_producer.worker_stash
+    update_consumer_state = worker_stash.update_consumer_state
+
+    def slow_update_consumer_state(**kwargs):
+        written.append(kwargs["worker_uid"])
+        writing.set()
+        release.wait(5)
+        return update_consumer_state(**kwargs)
+
+    worker_stash.update_consumer_state = slow_update_consumer_state
+    stateful_producer.update_consumer_state_for_worker(
+        worker.syft_worker_id, ConsumerState.IDLE
+    )
+    stateful_producer.update_consumer_state_for_worker(
+        dispatched_worker.syft_worker_id, ConsumerState.IDLE
+    )
+    assert writing.wait(5)
+
+    # the poll thread does not wait for the write in progress
+    discard = threading.Thread(
+        target=stateful_producer.discard_consumer_state_for_worker,
+        args=(dispatched_worker.syft_worker_id,),
+    )
+    discard.start()
+    discard.join(1)
+    assert not discard.is_alive()
+
+    release.set()
+    sleep(CONSUMER_STATE_FLUSH_INTERVAL_SEC * 5)
+
+    # the state of the dispatched worker went stale and is not written
+    assert written == [worker.syft_worker_id]
+    assert _consumer_state(stateful_producer, worker) == ConsumerState.IDLE
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+def test_zmq_producer_dispatches_queued_item_without_poll_timeout(
+    stateful_producer,
+) -> None:
+    service = Service("my-service")
+    stateful_producer.services[service.name] = service
+    worker = _add_syft_worker(stateful_producer, service)
+    stateful_producer.worker_waiting(worker)
+
+    sent = threading.Event()
+    stateful_producer.send_to_worker = lambda *args, **kwargs: sent.set()
+
+    class QueueStash:
+        root_verify_key = None
+        items: list = []
+
+        def get_by_statuses(self, credentials, statuses):
+            items, self.items = self.items, []
+            return Ok({Status.CREATED: items, Status.PROCESSING: []})
+
+    def queue_item(item) -> bool:
+        service.requests.append(b"request")
+        return True
+
+    stateful_producer.queue_stash = QueueStash()
+    stateful_producer.queue_item = queue_item
+    stateful_producer.thread = threading.Thread(
+        target=stateful_producer._run, daemon=True
+    )
+    stateful_producer.producer_thread = threading.Thread(
+        target=stateful_producer.read_items, daemon=True
+    )
+    stateful_producer.thread.start()
+    stateful_producer.producer_thread.start()
+    # both threads are idle, _run is blocked in its poll
+    sleep(0.3)
+
+    stateful_producer.queue_stash.items = [SimpleNamespace(id=UID())]
+    start = time()
+    stateful_producer.notify()
+    assert sent.wait(ZMQ_POLLER_TIMEOUT_MSEC / 1000)
+    # the request does not wait for the poll to time out
+    assert time() - start < ZMQ_POLLER_TIMEOUT_MSEC / 1000 / 4
+
+
 @pytest.fixture
 def queue_manager():
     # Create a consumer
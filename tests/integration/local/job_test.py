@@ -23,10 +23,9 @@ def test_job_restart(job) -> None:
     assert wait_until(
         lambda: job.fetched_status == JobStatus.PROCESSING
     ), "Job not started"
+    # job.subjobs fetches all subjobs with their current status in one request
     assert wait_until(
-        lambda: all(
-            subjob.fetched_status == JobStatus.PROCESSING for subjob in job.subjobs
-        )
+        lambda: all(subjob.status == JobStatus.PROCESSING for subjob in job.subjobs)
     ), "Subjobs not started"
 
     result = job.subjobs[0].restart()
@@ -49,11 +48,7 @@ def test_job_restart(job) -> None:
     ), "Job not restarted"
     assert wait_until(
         lambda: len(
-            [
-                subjob.fetched_status == JobStatus.PROCESSING
-                for subjob in job.subjobs
-                if subjob.fetched_status != JobStatus.INTERRUPTED
-            ]
+            [subjob for subjob in job.subjobs if subjob.status != JobStatus.INTERRUPTED]
         )
         == 2
     ), "Subjobs not restarted"
@@ -120,10 +115,9 @@ def test_job_kill(job) -> None:
     assert wait_until(
         lambda: job.fetched_status == JobStatus.PROCESSING
     ), "Job not started"
+    # job.subjobs fetches all subjobs with their current status in one request
     assert wait_until(
-        lambda: all(
-            subjob.fetched_status == JobStatus.PROCESSING for subjob in job.subjobs
-        )
+        lambda: all(subjob.status == JobStatus.PROCESSING for subjob in job.subjobs)
     ), "Subjobs not started"
 
     result = job.subjobs[0].kill()